@@ -4,8 +4,21 @@ DSPy Graph Framework
 A minimal framework for building graph-based workflows with DSPy nodes.
 """
 
+from .cache import InvocationCache, ResponseCache
+from .config import configure_dspy, get_lm
+from .constants import DEFAULT_MODEL
 from .graph import END, START, Graph
 from .node import Node
 
-__all__ = ["Node", "Graph", "START", "END"]
+__all__ = [
+    "Node",
+    "Graph",
+    "START",
+    "END",
+    "configure_dspy",
+    "get_lm",
+    "DEFAULT_MODEL",
+    "ResponseCache",
+    "InvocationCache",
+]
 __version__ = "0.1.0"
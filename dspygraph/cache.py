@@ -0,0 +1,126 @@
+"""
+On-disk response cache for node executions
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+def _normalize_text(value: str) -> str:
+    """Normalize text so trivially different phrasings share a cache key"""
+    return " ".join(value.lower().split()).rstrip("?!. ")
+
+
+def _cache_key(model_name: str, node_name: str, state: dict[str, Any]) -> str:
+    """Build a cache key from a node's input state"""
+    parts = [model_name, node_name]
+    for key in sorted(state):
+        if key.startswith("_"):
+            continue
+        value = state[key]
+        if isinstance(value, str):
+            value = _normalize_text(value)
+        parts.append(f"{key}={value!r}")
+    # blake2b is the fastest hash in the stdlib and this runs on every
+    # cached node execution; 16 bytes is plenty for collision resistance
+    # on cache keys
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    A persistent exact-match cache for node outputs
+
+    Keys are derived from the node's input state with whitespace, case, and
+    trailing punctuation normalized, so near-identical questions ("What's the
+    capital of France?" vs "capital of france") can share an entry. Entries
+    are invalidated when the model name changes.
+    """
+
+    def __init__(self, path: str, model_name: str = ""):
+        self.path = path
+        self.model_name = model_name
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached entries from disk, discarding stale model versions"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if record.get("model_name") != self.model_name:
+                    continue
+                self._entries[record["key"]] = record["outputs"]
+
+    def key_for(self, node_name: str, state: dict[str, Any]) -> str:
+        """Build a cache key from a node's input state"""
+        return _cache_key(self.model_name, node_name, state)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return cached outputs for a key, or None on miss"""
+        outputs = self._entries.get(key)
+        return dict(outputs) if outputs is not None else None
+
+    def put(self, key: str, outputs: dict[str, Any]) -> None:
+        """Store outputs for a key and append them to the cache file"""
+        outputs = {k: v for k, v in outputs.items() if not k.startswith("_")}
+        self._entries[key] = outputs
+
+        cache_dir = os.path.dirname(self.path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with open(self.path, "a") as f:
+            record = {"key": key, "model_name": self.model_name, "outputs": outputs}
+            f.write(json.dumps(record) + "\n")
+
+
+class InvocationCache:
+    """
+    An in-memory LRU cache for node outputs
+
+    Uses the same key scheme and get/put interface as ResponseCache, so it
+    drops into Node(cache=...) unchanged, but keeps entries in process
+    memory with least-recently-used eviction instead of appending to a
+    file. Suited to repeated runs inside one process — loops, notebooks,
+    tests — where the same node sees the same inputs again and again.
+    """
+
+    def __init__(self, max_entries: int = 512, model_name: str = ""):
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Nodes sharing a cache may execute from the graph's pool threads;
+        # the lock keeps the lookup/recency and insert/evict sequences atomic
+        self._lock = threading.Lock()
+
+    def key_for(self, node_name: str, state: dict[str, Any]) -> str:
+        """Build a cache key from a node's input state"""
+        return _cache_key(self.model_name, node_name, state)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return cached outputs for a key, or None on miss"""
+        with self._lock:
+            outputs = self._entries.get(key)
+            if outputs is None:
+                return None
+            self._entries.move_to_end(key)
+            return dict(outputs)
+
+    def put(self, key: str, outputs: dict[str, Any]) -> None:
+        """Store outputs for a key, evicting the least recently used entry"""
+        entry = {k: v for k, v in outputs.items() if not k.startswith("_")}
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,64 @@
+"""
+DSPy configuration utilities
+"""
+
+import threading
+from typing import Any
+
+import dspy
+
+from .constants import DEFAULT_MODEL
+
+# Shared LM instances, one per model name. A plain dict with a lock instead
+# of lru_cache: no hash overhead on the hot configure path, and kwargs
+# (which may be unhashable) simply bypass the cache.
+_lm_cache: dict[str, dspy.LM] = {}
+_lm_lock = threading.Lock()
+
+
+def get_lm(model: str = DEFAULT_MODEL, **lm_kwargs: Any) -> dspy.LM:
+    """
+    Get a shared language model client for a model name
+
+    Clients hold connection pools, so reconstructing one per request wastes
+    both allocation and connection setup. Calls with explicit lm_kwargs get
+    a fresh instance since they may differ from the cached configuration.
+
+    Args:
+        model: Model identifier (litellm format, e.g. "openai/gpt-4o-mini")
+        **lm_kwargs: Extra keyword arguments forwarded to dspy.LM
+
+    Returns:
+        A dspy.LM instance, shared across callers when no kwargs are given
+    """
+    if lm_kwargs:
+        return dspy.LM(model, **lm_kwargs)
+
+    with _lm_lock:
+        lm = _lm_cache.get(model)
+        if lm is None:
+            # cache=True (explicit) keeps dspy's response cache on; together
+            # with compile-time-frozen demo order this keeps prompt prefixes
+            # byte-stable, so providers with automatic prompt caching can
+            # skip prefill on the shared few-shot block
+            lm = _lm_cache[model] = dspy.LM(model, cache=True)
+        return lm
+
+
+def configure_dspy(model: str = DEFAULT_MODEL, **lm_kwargs: Any) -> dspy.LM:
+    """
+    Configure DSPy with a language model
+
+    Centralizes LM construction so batch endpoints, caching, or alternate
+    providers can be enabled in one place instead of at every call site.
+
+    Args:
+        model: Model identifier (litellm format, e.g. "openai/gpt-4o-mini")
+        **lm_kwargs: Extra keyword arguments forwarded to dspy.LM
+
+    Returns:
+        The configured dspy.LM instance
+    """
+    lm = get_lm(model, **lm_kwargs)
+    dspy.configure(lm=lm)
+    return lm
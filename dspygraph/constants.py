@@ -0,0 +1,6 @@
+"""
+Framework constants
+"""
+
+# Default language model for both compilation and runtime
+DEFAULT_MODEL = "openai/gpt-4o-mini"
@@ -2,19 +2,43 @@
 DSPy Graph execution engine
 """
 
+import asyncio
+import logging
+import sys
 import time
 import uuid
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-import dspy
-
 from .node import Node
 
-# Module-level constants for graph control
-START = "__START__"
-END = "__END__"
+logger = logging.getLogger("dspygraph")
+
+# Module-level constants for graph control. Interned so that edge endpoints
+# (also interned in add_edge) can be compared by pointer identity in the run
+# loop; the values stay plain strings for external comparisons.
+START = sys.intern("__START__")
+END = sys.intern("__END__")
+
+
+class _BranchCondition:
+    """Edge condition that fires when condition_fn(state) equals key
+
+    Sibling branches from one add_conditional_edges call share the same
+    condition_fn; exposing it lets the ready scan evaluate the router once
+    and dispatch every branch off that single result.
+    """
+
+    __slots__ = ("condition_fn", "key")
+
+    def __init__(self, condition_fn: Callable[[dict[str, Any]], str], key: str):
+        self.condition_fn = condition_fn
+        self.key = key
+
+    def __call__(self, state: dict[str, Any]) -> bool:
+        return self.condition_fn(state) == self.key
 
 
 class Graph:
@@ -29,6 +53,21 @@ class Graph:
         self.edges: list[tuple] = []
         self.start_nodes: set[str] = set()
         self._execution_count = 0
+        # Incremental edge indexes so the run loop doesn't re-scan self.edges
+        self._incoming: dict[str, list[tuple]] = defaultdict(list)
+        self._outgoing: dict[str, list[tuple]] = defaultdict(list)
+        # Cached topology analyses; None means the topology changed since
+        # the last computation
+        self._cycle_cache: bool | None = None
+        self._depth_cache: dict[str, int] | None = None
+        self._viz_cache: tuple[tuple[bool, ...], str] | None = None
+        # Per-run metadata starts from this template: graph_name and
+        # graph_id are fixed at construction, so each run copies the dict
+        # with its hash table already shaped instead of rebuilding it
+        self._metadata_template = {
+            "graph_name": name,
+            "graph_id": self.graph_id,
+        }
 
     def add_node(self, node: Node) -> "Graph":
         """
@@ -43,8 +82,11 @@ class Graph:
         if node.name in self.nodes:
             raise ValueError(f"Node '{node.name}' already exists in graph")
 
-        self.nodes[node.name] = node
-        print(f"[{self.name}] Added node: {node.name}")
+        # Intern the name so the run loop's set/dict lookups compare by
+        # pointer identity instead of character-by-character
+        self.nodes[sys.intern(node.name)] = node
+        self._viz_cache = None
+        logger.debug("[%s] Added node: %s", self.name, node.name)
         return self
 
     def add_edge(
@@ -64,18 +106,26 @@ class Graph:
         Returns:
             Self for method chaining
         """
+        from_node = sys.intern(from_node)
+        to_node = sys.intern(to_node)
+
         # Validate nodes exist (unless START/END)
-        if from_node != START and from_node not in self.nodes:
+        if from_node is not START and from_node not in self.nodes:
             raise ValueError(f"Source node '{from_node}' not found")
-        if to_node != END and to_node not in self.nodes:
+        if to_node is not END and to_node not in self.nodes:
             raise ValueError(f"Target node '{to_node}' not found")
 
         # Track start nodes
-        if from_node == START:
+        if from_node is START:
             self.start_nodes.add(to_node)
 
         self.edges.append((from_node, to_node, condition))
-        print(f"[{self.name}] Added edge: {from_node} -> {to_node}")
+        self._incoming[to_node].append((from_node, condition))
+        self._outgoing[from_node].append((to_node, condition))
+        self._cycle_cache = None
+        self._depth_cache = None
+        self._viz_cache = None
+        logger.debug("[%s] Added edge: %s -> %s", self.name, from_node, to_node)
         return self
 
     def add_conditional_edges(
@@ -96,14 +146,7 @@ class Graph:
             Self for method chaining
         """
         for condition_key, to_node in conditions.items():
-
-            def make_condition(key):
-                def condition(state):
-                    return condition_fn(state) == key
-
-                return condition
-
-            self.add_edge(from_node, to_node, make_condition(condition_key))
+            self.add_edge(from_node, to_node, _BranchCondition(condition_fn, condition_key))
         return self
 
     def _get_ready_nodes(
@@ -118,17 +161,28 @@ class Graph:
 
         ready = []
 
+        # State doesn't change during a scan, so each conditional router
+        # runs at most once here no matter how many branches share it
+        router_results: dict[int, str] = {}
+
+        def edge_satisfied(condition) -> bool:
+            if condition is None:
+                return True
+            condition_fn = getattr(condition, "condition_fn", None)
+            if condition_fn is None:
+                return condition(state)
+            fn_id = id(condition_fn)
+            if fn_id not in router_results:
+                router_results[fn_id] = condition_fn(state)
+            return router_results[fn_id] == condition.key
+
         for node_name in self.nodes:
             # Don't execute a node twice in the same iteration
             if node_name in executed_this_iteration:
                 continue
 
             # Check if this node has any incoming edges (including from START)
-            incoming_edges = [
-                (from_node, condition)
-                for from_node, to_node, condition in self.edges
-                if to_node == node_name
-            ]
+            incoming_edges = self._incoming[node_name]
 
             if not incoming_edges:
                 # Legacy: This is a start node (no incoming edges) - keep for backwards compatibility
@@ -139,33 +193,105 @@ class Graph:
                 node_ready = False
                 for from_node, condition in incoming_edges:
                     # Handle START specially - it's always "completed"
-                    if from_node == START:
-                        if condition is None or condition(state):
+                    if from_node is START:
+                        if edge_satisfied(condition):
                             # Only run START edges if node hasn't been completed yet
                             if node_name not in completed:
                                 node_ready = True
                                 break
                     elif from_node in completed:
-                        if condition is None or condition(state):
+                        if edge_satisfied(condition):
                             # If this node hasn't been executed yet, always allow first execution
                             if node_name not in completed:
                                 node_ready = True
                                 break
                             # For re-execution (cycles): allow if there are outgoing edges
                             # This enables cycles but relies on iteration limits for protection
-                            else:
-                                outgoing_edges = [
-                                    edge for edge in self.edges if edge[0] == node_name
-                                ]
-                                if outgoing_edges:
-                                    node_ready = True
-                                    break
+                            elif self._outgoing[node_name]:
+                                node_ready = True
+                                break
 
                 if node_ready:
                     ready.append(node_name)
 
         return ready
 
+    def _has_cycle(self) -> bool:
+        """
+        Detect whether the graph contains a cycle
+
+        Uses Kahn's algorithm: repeatedly peel off zero in-degree nodes; any
+        node left unpeeled sits on a cycle. The pass is iterative and O(N+E),
+        and the result is cached until add_edge changes the topology, so
+        repeated run() calls on a fixed graph pay the traversal once.
+        """
+        if self._cycle_cache is not None:
+            return self._cycle_cache
+
+        indegree = dict.fromkeys(self.nodes, 0)
+        for node_name in self.nodes:
+            for to_node, _condition in self._outgoing[node_name]:
+                if to_node is not END:
+                    indegree[to_node] += 1
+
+        queue = [name for name, degree in indegree.items() if degree == 0]
+        peeled = 0
+        while queue:
+            node_name = queue.pop()
+            peeled += 1
+            for to_node, _condition in self._outgoing[node_name]:
+                if to_node is not END:
+                    indegree[to_node] -= 1
+                    if indegree[to_node] == 0:
+                        queue.append(to_node)
+
+        self._cycle_cache = peeled != len(self.nodes)
+        return self._cycle_cache
+
+    def _critical_path_depths(self) -> dict[str, int]:
+        """
+        Longest edge-count distance from each node toward the graph's sinks
+
+        Used to rank ready nodes so the deepest branch — the one bounding
+        total makespan — is handed to the executor pool first when more
+        nodes are ready than max_parallel_nodes allows at once. Cached
+        until add_edge changes the topology; cyclic graphs return an empty
+        map since longest path is undefined there.
+        """
+        if self._depth_cache is not None:
+            return self._depth_cache
+
+        if self._has_cycle():
+            self._depth_cache = {}
+            return self._depth_cache
+
+        # Kahn peel gives a topological order; walking it in reverse means
+        # every successor's depth is known when a node is scored
+        indegree = dict.fromkeys(self.nodes, 0)
+        for node_name in self.nodes:
+            for to_node, _condition in self._outgoing[node_name]:
+                if to_node is not END:
+                    indegree[to_node] += 1
+
+        order: list[str] = [name for name, degree in indegree.items() if degree == 0]
+        for node_name in order:
+            for to_node, _condition in self._outgoing[node_name]:
+                if to_node is not END:
+                    indegree[to_node] -= 1
+                    if indegree[to_node] == 0:
+                        order.append(to_node)
+
+        depths = dict.fromkeys(self.nodes, 0)
+        for node_name in reversed(order):
+            for to_node, _condition in self._outgoing[node_name]:
+                if to_node is not END:
+                    depths[node_name] = max(
+                        depths[node_name], depths[to_node] + 1
+                    )
+
+        self._depth_cache = depths
+        return depths
+
     def _validate_graph(self) -> None:
         """Validate the graph for common issues"""
         if not self.nodes:
@@ -174,8 +300,21 @@ class Graph:
         if not self.start_nodes and self.edges:
             raise ValueError("Graph has edges but no start nodes defined")
 
+        # Cycles are allowed (e.g. React-style reasoning loops) but worth
+        # surfacing since termination then depends on iteration limits
+        if self._has_cycle():
+            logger.info(
+                "[%s] Graph contains cycles; relying on iteration limits for termination",
+                self.name,
+            )
+
     def run(
-        self, max_iterations: int = 100, max_node_executions: int = 10, **initial_state
+        self,
+        max_iterations: int = 100,
+        max_node_executions: int = 10,
+        max_parallel_nodes: int = 8,
+        collect_metadata: bool = True,
+        **initial_state,
     ) -> dict[str, Any]:
         """
         Execute the graph
@@ -183,6 +322,11 @@ class Graph:
         Args:
             max_iterations: Maximum total iterations before stopping (default: 100)
             max_node_executions: Maximum executions per node before warning (default: 10)
+            max_parallel_nodes: Maximum nodes executed concurrently when
+                multiple are ready (default: 8)
+            collect_metadata: Whether to assemble _graph_metadata in the
+                result; high-throughput callers that never read it can
+                skip its construction (default: True)
             **initial_state: Initial state values
 
         Returns:
@@ -191,11 +335,9 @@ class Graph:
         execution_id = str(uuid.uuid4())
         self._execution_count += 1
 
-        print(f"\n{'=' * 60}")
-        print(f"[{self.name}] Starting execution {self._execution_count}")
-        print(f"[{self.name}] Execution ID: {execution_id}")
-        print(f"[{self.name}] Initial state: {list(initial_state.keys())}")
-        print(f"{'=' * 60}")
+        logger.info("[%s] Starting execution %s", self.name, self._execution_count)
+        logger.info("[%s] Execution ID: %s", self.name, execution_id)
+        logger.info("[%s] Initial state: %s", self.name, list(initial_state.keys()))
 
         start_time = time.time()
 
@@ -209,21 +351,23 @@ class Graph:
             # Initialize tracking
             completed = set()
             node_execution_order = []
-            total_usage = defaultdict(int)
+            total_usage = Counter()
             node_execution_counts = defaultdict(int)  # Track executions per node
             iteration_count = 0  # Track total iterations
             nodes_executed_this_iteration = (
                 set()
             )  # Track nodes executed in current iteration
 
-            # Track graph metadata
-            state["_graph_metadata"] = {
-                "graph_name": self.name,
-                "graph_id": self.graph_id,
-                "execution_id": execution_id,
-                "execution_count": self._execution_count,
-                "start_time": start_time,
-            }
+            # Track graph metadata. A single dict created once and mutated in
+            # place: nodes see it by reference, so nothing is copied per
+            # iteration. It stays a plain dict because it is part of the
+            # public result shape.
+            metadata = None
+            if collect_metadata:
+                metadata = state["_graph_metadata"] = self._metadata_template.copy()
+                metadata["execution_id"] = execution_id
+                metadata["execution_count"] = self._execution_count
+                metadata["start_time"] = start_time
 
             # Main execution loop
             while True:
@@ -231,13 +375,22 @@ class Graph:
 
                 # Check max iterations
                 if iteration_count > max_iterations:
-                    print(
-                        f"\n[{self.name}] WARNING: Reached maximum iterations ({max_iterations})"
-                    )
-                    print(f"[{self.name}] Stopping execution to prevent infinite loop")
-                    state["_graph_metadata"]["stopped_reason"] = (
-                        f"max_iterations_reached ({max_iterations})"
+                    logger.warning(
+                        "[%s] Reached maximum iterations (%s); stopping execution to prevent infinite loop",
+                        self.name,
+                        max_iterations,
                     )
+                    if metadata is not None:
+                        metadata["stopped_reason"] = (
+                            f"max_iterations_reached ({max_iterations})"
+                        )
+                    break
+
+                # Check termination first: it only scans END's incoming
+                # edges, so a run that just routed to END skips the full
+                # ready-node scan below entirely
+                if self._check_for_termination(completed, state):
+                    logger.info("[%s] Workflow terminated early via END", self.name)
                     break
 
                 # Reset per-iteration tracking
@@ -251,84 +404,87 @@ class Graph:
                     # No more nodes ready - check if this is expected
                     remaining = set(self.nodes.keys()) - completed
                     if remaining:
-                        print(
-                            f"[{self.name}] Workflow complete. Skipped nodes: {remaining}"
+                        logger.info(
+                            "[%s] Workflow complete. Skipped nodes: %s",
+                            self.name,
+                            remaining,
                         )
                     break
 
-                # Check if any ready node should terminate early
-                should_terminate = self._check_for_termination(completed, state)
-                if should_terminate:
-                    print(f"[{self.name}] Workflow terminated early via END")
-                    break
+                # Critical-path scheduling: start the deepest branch first so
+                # it isn't stuck behind shallow siblings when the ready set
+                # exceeds the pool size
+                if len(ready_nodes) > 1:
+                    depths = self._critical_path_depths()
+                    if depths:
+                        ready_nodes.sort(key=depths.__getitem__, reverse=True)
 
-                print(f"\n[{self.name}] Ready to execute: {ready_nodes}")
+                logger.info("[%s] Ready to execute: %s", self.name, ready_nodes)
 
-                # Execute ready nodes (could be parallelized here)
+                # Track executions before fanning out
                 for node_name in ready_nodes:
-                    node = self.nodes[node_name]
-
-                    # Track executions
                     node_execution_counts[node_name] += 1
                     nodes_executed_this_iteration.add(node_name)
 
                     if node_execution_counts[node_name] > max_node_executions:
-                        print(
-                            f"\n[{self.name}] WARNING: Node '{node_name}' has been executed {node_execution_counts[node_name]} times"
-                        )
-                        print(
-                            f"[{self.name}] This may indicate an infinite loop in your graph logic"
+                        logger.warning(
+                            "[%s] Node '%s' has been executed %s times; this may indicate an infinite loop in your graph logic",
+                            self.name,
+                            node_name,
+                            node_execution_counts[node_name],
                         )
 
-                    try:
-                        # Execute node with full observability
-                        with dspy.track_usage() as usage:
-                            node_outputs = node(state)
+                # Execute ready nodes (in parallel when more than one is ready)
+                results = self._execute_ready_nodes(
+                    ready_nodes, state, max_parallel_nodes
+                )
 
-                        # Update state with node outputs, protecting metadata
-                        for key, value in node_outputs.items():
-                            if key != "_graph_metadata":  # Protect graph metadata
-                                state[key] = value
+                # Merge node outputs into state in ready order, protecting
+                # metadata; parallel writes to the same key are last-writer-wins
+                for node_name, node_outputs, node_usage in results:
+                    for key, value in node_outputs.items():
+                        if key != "_graph_metadata":  # Protect graph metadata
+                            state[key] = value
 
-                        # Track execution
-                        completed.add(node_name)
-                        node_execution_order.append(node_name)
+                    # Track execution
+                    completed.add(node_name)
+                    node_execution_order.append(node_name)
 
-                        # Accumulate usage stats
-                        node_usage = usage.get_total_tokens()
-                        for key, value in node_usage.items():
-                            total_usage[key] += value
+                    # Accumulate usage stats in one batched update
+                    total_usage.update(node_usage)
 
-                    except Exception as e:
-                        print(f"[{self.name}] Node '{node_name}' failed: {e}")
-                        raise
 
             execution_time = time.time() - start_time
 
             # Add final metadata
-            state["_graph_metadata"].update(
-                {
-                    "execution_order": node_execution_order,
-                    "execution_time": execution_time,
-                    "total_usage": dict(total_usage),
-                    "nodes_executed": len(completed),
-                    "success": True,
-                    "total_iterations": iteration_count,
-                    "node_execution_counts": dict(node_execution_counts),
-                }
-            )
+            if metadata is not None:
+                metadata.update(
+                    {
+                        "execution_order": node_execution_order,
+                        "execution_time": execution_time,
+                        "total_usage": dict(total_usage),
+                        "nodes_executed": len(completed),
+                        "success": True,
+                        "total_iterations": iteration_count,
+                        "node_execution_counts": dict(node_execution_counts),
+                    }
+                )
 
-            print(f"\n{'=' * 60}")
-            print(f"[{self.name}] Execution complete in {execution_time:.3f}s")
-            print(f"[{self.name}] Nodes executed: {' -> '.join(node_execution_order)}")
-            print(f"[{self.name}] Total usage: {dict(total_usage)}")
-            print(f"{'=' * 60}\n")
+            logger.info(
+                "[%s] Execution complete in %.3fs", self.name, execution_time
+            )
+            logger.info(
+                "[%s] Nodes executed: %s", self.name, " -> ".join(node_execution_order)
+            )
+            logger.info("[%s] Total usage: %s", self.name, dict(total_usage))
 
             return state
 
         except Exception as e:
             execution_time = time.time() - start_time
-            print(f"\n[{self.name}] Execution failed after {execution_time:.3f}s: {e}")
+            logger.error(
+                "[%s] Execution failed after %.3fs: %s", self.name, execution_time, e
+            )
 
             # Add failure metadata
             if "_graph_metadata" in state:
@@ -342,8 +498,92 @@ class Graph:
 
             raise
 
+    async def arun(
+        self,
+        max_iterations: int = 100,
+        max_node_executions: int = 10,
+        max_parallel_nodes: int = 8,
+        collect_metadata: bool = True,
+        **initial_state,
+    ) -> dict[str, Any]:
+        """
+        Execute the graph asynchronously
+
+        Runs the synchronous run() in a worker thread (mirroring Node.acall)
+        so async applications can overlap whole graph executions without
+        blocking the event loop on network-bound LM calls.
+
+        Args:
+            max_iterations: Maximum total iterations before stopping (default: 100)
+            max_node_executions: Maximum executions per node before warning (default: 10)
+            max_parallel_nodes: Maximum nodes executed concurrently when
+                multiple are ready (default: 8)
+            collect_metadata: Whether to assemble _graph_metadata in the
+                result (default: True)
+            **initial_state: Initial state values
+
+        Returns:
+            Final graph state
+        """
+        return await asyncio.to_thread(
+            lambda: self.run(
+                max_iterations=max_iterations,
+                max_node_executions=max_node_executions,
+                max_parallel_nodes=max_parallel_nodes,
+                collect_metadata=collect_metadata,
+                **initial_state,
+            )
+        )
+
+    def _execute_ready_nodes(
+        self,
+        ready_nodes: list[str],
+        state: dict[str, Any],
+        max_parallel_nodes: int,
+    ) -> list[tuple[str, dict[str, Any], dict[str, Any]]]:
+        """
+        Execute the ready nodes, fanning out to a bounded thread pool when
+        several are ready at once
+
+        Node work is LM-bound, so independent branches overlap their latency
+        instead of paying it serially.
+
+        Returns:
+            List of (node_name, outputs, usage) tuples in ready order
+        """
+
+        def execute_one(node_name: str) -> tuple[str, dict[str, Any], dict[str, Any]]:
+            node = self.nodes[node_name]
+            try:
+                node_outputs = node(state)
+            except Exception as e:
+                logger.error("[%s] Node '%s' failed: %s", self.name, node_name, e)
+                raise
+
+            # Node.__call__ already tracks usage; reuse its numbers instead
+            # of nesting a second dspy.track_usage context per node
+            usage = node_outputs.get("_node_metadata", {}).get("usage") or {}
+            return node_name, node_outputs, usage
+
+        if len(ready_nodes) == 1:
+            return [execute_one(ready_nodes[0])]
+
+        max_workers = min(len(ready_nodes), max_parallel_nodes)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(execute_one, ready_nodes))
+
     def visualize(self) -> str:
-        """Generate a simple text visualization of the graph"""
+        """Generate a simple text visualization of the graph
+
+        The rendered string is cached until add_node/add_edge mutates the
+        topology, so repeated calls skip the O(V+E) formatting. The nodes'
+        compiled flags can flip without a topology change, so they key the
+        cache too.
+        """
+        compiled_flags = tuple(node.compiled for node in self.nodes.values())
+        if self._viz_cache is not None and self._viz_cache[0] == compiled_flags:
+            return self._viz_cache[1]
+
         lines = [f"DSPy Graph: {self.name}"]
         lines.append(f"Nodes: {len(self.nodes)}")
         lines.append(f"Edges: {len(self.edges)}")
@@ -361,14 +601,16 @@ class Graph:
             condition_indicator = " [CONDITIONAL]" if condition else ""
             lines.append(f"  {from_node} -> {to_node}{condition_indicator}")
 
-        return "\n".join(lines)
+        rendered = "\n".join(lines)
+        self._viz_cache = (compiled_flags, rendered)
+        return rendered
 
     def _check_for_termination(
         self, completed: set[str], state: dict[str, Any]
     ) -> bool:
         """Check if any completed node routes to END"""
-        for from_node, to_node, condition in self.edges:
-            if to_node == END and from_node in completed:
+        for from_node, condition in self._incoming[END]:
+            if from_node in completed:
                 if condition is None or condition(state):
                     return True
         return False
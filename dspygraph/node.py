@@ -2,27 +2,64 @@
 DSPy Node abstraction with built-in observability
 """
 
+import asyncio
+import functools
+import logging
+import sys
 import time
 import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import dspy
 from dspy.teleprompt import Teleprompter
 
+from .cache import InvocationCache, ResponseCache
+
+logger = logging.getLogger("dspygraph")
+
 
 class Node(ABC):
     """
     A DSPy node that wraps a DSPy module with observability and compilation support
     """
 
-    def __init__(self, name: str):
-        self.name = name
-        self.node_id = str(uuid.uuid4())
-        self.module = self._create_module()
+    def __init__(self, name: str, cache: ResponseCache | InvocationCache | None = None):
+        # Interned to match the graph's interned node keys, so name lookups
+        # and comparisons during dispatch short-circuit on pointer identity
+        self.name = sys.intern(name)
+        # Keep the raw 128-bit value; the canonical string only exists if
+        # something reads node_id (logging, metadata), so construction does
+        # no string formatting
+        self._uuid_int = uuid.uuid4().int
+        self._module: dspy.Module | None = None
         self.compiled = False
+        self.cache = cache
         self._execution_count = 0
 
+    @functools.cached_property
+    def node_id(self) -> str:
+        """Canonical UUID string for this node, formatted on first access"""
+        return str(uuid.UUID(int=self._uuid_int))
+
+    @property
+    def module(self) -> dspy.Module:
+        """The node's DSPy module, built on first access
+
+        Module construction (signature parsing, demo loading) is deferred
+        until something actually uses the module, so nodes that are only
+        wired into a graph — or whose module is replaced before use — pay
+        nothing for it.
+        """
+        if self._module is None:
+            self._module = self._create_module()
+        return self._module
+
+    @module.setter
+    def module(self, module: dspy.Module) -> None:
+        self._module = module
+
     @abstractmethod
     def _create_module(self) -> dspy.Module:
         """Create the DSPy module for this node"""
@@ -38,6 +75,7 @@ class Node(ABC):
         compiler: Teleprompter,
         trainset: list[dspy.Example],
         compile_path: str | None = None,
+        **compile_kwargs: Any,
     ) -> None:
         """
         Compile this node's module
@@ -46,15 +84,23 @@ class Node(ABC):
             compiler: DSPy teleprompter instance
             trainset: Training data for compilation
             compile_path: Optional path to save compiled model
+            **compile_kwargs: Extra keyword arguments forwarded to
+                compiler.compile (e.g. valset for teleprompters that accept one)
         """
-        print(f"[{self.name}] Starting compilation...")
+        logger.info("[%s] Starting compilation...", self.name)
 
         with dspy.track_usage() as usage:
-            compiled_module = compiler.compile(self.module, trainset=trainset)
+            compiled_module = compiler.compile(
+                self.module, trainset=trainset, **compile_kwargs
+            )
             self.module = compiled_module
             self.compiled = True
 
-        print(f"[{self.name}] Compilation complete. Usage: {usage.get_total_tokens()}")
+        logger.info(
+            "[%s] Compilation complete. Usage: %s",
+            self.name,
+            usage.get_total_tokens(),
+        )
 
         if compile_path:
             self.save_compiled(compile_path)
@@ -64,15 +110,15 @@ class Node(ABC):
         try:
             self.module.load(path)
             self.compiled = True
-            print(f"[{self.name}] Loaded compiled module from {path}")
+            logger.info("[%s] Loaded compiled module from %s", self.name, path)
         except Exception as e:
-            print(f"[{self.name}] Failed to load compiled module: {e}")
+            logger.error("[%s] Failed to load compiled module: %s", self.name, e)
             raise
 
     def save_compiled(self, path: str) -> None:
         """Save the compiled module to file"""
         self.module.save(path)
-        print(f"[{self.name}] Saved compiled module to {path}")
+        logger.info("[%s] Saved compiled module to %s", self.name, path)
 
     def __call__(self, state: dict[str, Any]) -> dict[str, Any]:
         """
@@ -87,10 +133,32 @@ class Node(ABC):
         execution_id = str(uuid.uuid4())
         self._execution_count += 1
 
-        print(
-            f"[{self.name}] Starting execution {self._execution_count} (id: {execution_id[:8]})"
+        logger.info(
+            "[%s] Starting execution %s (id: %s)",
+            self.name,
+            self._execution_count,
+            execution_id[:8],
         )
 
+        # Serve from the response cache when one is configured
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key_for(self.name, state)
+            cached_outputs = self.cache.get(cache_key)
+            if cached_outputs is not None:
+                logger.info("[%s] Cache hit, skipping execution", self.name)
+                cached_outputs["_node_metadata"] = {
+                    "node_name": self.name,
+                    "node_id": self.node_id,
+                    "execution_id": execution_id,
+                    "execution_count": self._execution_count,
+                    "execution_time": 0.0,
+                    "compiled": self.compiled,
+                    "usage": {},
+                    "cached": True,
+                }
+                return cached_outputs
+
         # Execute node processing with tracking
         start_time = time.time()
         try:
@@ -100,9 +168,14 @@ class Node(ABC):
             execution_time = time.time() - start_time
             usage_stats = usage.get_total_tokens()
 
-            print(f"[{self.name}] Execution complete in {execution_time:.3f}s")
-            print(f"[{self.name}] Token usage: {usage_stats}")
-            print(f"[{self.name}] Outputs: {list(outputs.keys())}")
+            logger.info(
+                "[%s] Execution complete in %.3fs", self.name, execution_time
+            )
+            logger.debug("[%s] Token usage: %s", self.name, usage_stats)
+            logger.debug("[%s] Outputs: %s", self.name, list(outputs.keys()))
+
+            if self.cache is not None:
+                self.cache.put(cache_key, outputs)
 
             # Add metadata to outputs
             outputs["_node_metadata"] = {
@@ -119,9 +192,51 @@ class Node(ABC):
 
         except Exception as e:
             execution_time = time.time() - start_time
-            print(f"[{self.name}] Execution failed after {execution_time:.3f}s: {e}")
+            logger.error(
+                "[%s] Execution failed after %.3fs: %s", self.name, execution_time, e
+            )
             raise
 
+    def batch_call(
+        self, states: list[dict[str, Any]], max_workers: int = 8
+    ) -> list[dict[str, Any]]:
+        """
+        Execute this node over many states at once
+
+        Bulk workloads (e.g. classifying a backlog of questions) should not
+        pay LM latency serially; states fan out to a bounded thread pool and
+        results come back in input order.
+
+        Args:
+            states: List of workflow states to process
+            max_workers: Maximum concurrent executions (default: 8)
+
+        Returns:
+            State updates for each input state, in the same order
+        """
+        if not states:
+            return []
+        if len(states) == 1:
+            return [self(states[0])]
+
+        with ThreadPoolExecutor(max_workers=min(len(states), max_workers)) as pool:
+            return list(pool.map(self, states))
+
+    async def acall(self, state: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute this node asynchronously
+
+        Runs the synchronous __call__ in a worker thread so I/O-bound LM
+        calls can overlap in async applications.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            State updates from this node's execution
+        """
+        return await asyncio.to_thread(self, state)
+
     def __repr__(self) -> str:
         return f"Node(name='{self.name}', compiled={self.compiled}, executions={self._execution_count})"
 
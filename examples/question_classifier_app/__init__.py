@@ -4,10 +4,16 @@ Question Classifier Application
 A DSPy graph-based system for classifying and routing questions to appropriate response modules.
 """
 
-from .graph import create_question_classifier_graph
+from .graph import (
+    create_fused_question_classifier_graph,
+    create_question_classifier_graph,
+    run_question_classifier_speculative,
+)
 from .nodes import (
     CreativeResponseNode,
     FactualAnswerNode,
+    FusedClassifierNode,
+    HybridQuestionClassifierNode,
     QuestionClassifierNode,
     ToolUseNode,
 )
@@ -17,8 +23,12 @@ __all__ = [
     "AgentState",
     "QuestionCategory",
     "QuestionClassifierNode",
+    "HybridQuestionClassifierNode",
     "FactualAnswerNode",
     "CreativeResponseNode",
+    "FusedClassifierNode",
     "ToolUseNode",
     "create_question_classifier_graph",
+    "create_fused_question_classifier_graph",
+    "run_question_classifier_speculative",
 ]
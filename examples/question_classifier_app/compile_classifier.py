@@ -3,10 +3,16 @@
 Compilation script for the question classifier using graph nodes
 """
 
+import argparse
+import functools
+import os
 from typing import Any
 
 import dspy
-from dspy.teleprompt import BootstrapFewShot
+from dspy.evaluate import Evaluate
+from dspy.teleprompt import BootstrapFewShot, BootstrapFewShotWithRandomSearch
+
+from dspygraph import DEFAULT_MODEL, configure_dspy
 
 from .nodes import QuestionClassifierNode
 
@@ -15,7 +21,9 @@ def classification_metric(
     pred_object: Any, true_category_str: str, trace: Any | None = None
 ) -> bool:
     """Metric for evaluating question classification accuracy"""
-    return pred_object.category == true_category_str
+    # Normalize case/whitespace so a cosmetically different but correct
+    # category is not scored as a miss during optimization
+    return str(pred_object.category).strip().lower() == true_category_str
 
 
 TRAINING_DATA = [
@@ -33,33 +41,165 @@ TRAINING_DATA = [
 ]
 
 
-def compile_classifier() -> None:
-    """Compile the question classifier node"""
+@functools.lru_cache(maxsize=1)
+def get_trainset() -> tuple[dspy.Example, ...]:
+    """
+    Build the training Examples once and reuse them
+
+    Repeated compile invocations (e.g. hyperparameter sweeps) would otherwise
+    reconstruct the same Example objects on every call.
+    """
+    return tuple(
+        dspy.Example(question=question, category=category).with_inputs("question")
+        for question, category in TRAINING_DATA
+    )
+
+
+def compile_num_threads() -> int:
+    """
+    Thread count for trainset evaluation
+
+    Compilation cost is dominated by LM latency, so threaded evaluation scales
+    roughly linearly with thread count until the provider rate limit. Override
+    with the DSPYGRAPH_COMPILE_THREADS environment variable.
+    """
+    env_value = os.getenv("DSPYGRAPH_COMPILE_THREADS")
+    if env_value:
+        return max(1, int(env_value))
+    return min(8, os.cpu_count() or 1)
+
+
+def run_classifier_batch(
+    module: dspy.Module,
+    examples: list[dspy.Example],
+    num_threads: int | None = None,
+) -> list[dspy.Example]:
+    """
+    Run the classifier over many examples with thread-pooled LM calls
+
+    A Python for-loop over the trainset pays LM latency once per example;
+    dspy's batch executor overlaps the I/O-bound calls, which is
+    near-linear up to the provider rate limit.
+
+    Args:
+        module: Classifier module (e.g. classifier.module after compilation)
+        examples: Examples with a 'question' input
+        num_threads: Thread count (defaults to DSPYGRAPH_COMPILE_THREADS
+            or CPU count)
+
+    Returns:
+        One prediction Example per input, in input order
+    """
+    return module.batch(
+        list(examples),
+        num_threads=num_threads or compile_num_threads(),
+        max_errors=0,
+    )
+
+
+def build_compiler(optimizer: str, num_threads: int):
+    """
+    Build the teleprompter for an optimizer name
+
+    'random-search' explores several candidate demo sets with threaded
+    evaluation and reuses dspy's on-disk LM cache across dev iterations;
+    'bootstrap' is the cheaper single-candidate variant.
+    """
+    if optimizer == "random-search":
+        return BootstrapFewShotWithRandomSearch(
+            metric=classification_metric,
+            max_bootstrapped_demos=4,
+            num_candidate_programs=6,
+            num_threads=num_threads,
+        )
+    if optimizer == "bootstrap":
+        return BootstrapFewShot(
+            metric=classification_metric, max_bootstrapped_demos=4, max_labeled_demos=8
+        )
+    raise ValueError(f"Unknown optimizer: {optimizer}")
+
+
+def compile_classifier(
+    model: str | None = None,
+    output: str = "compiled_classifier.json",
+    num_threads: int | None = None,
+    optimizer: str = "random-search",
+) -> None:
+    """
+    Compile the question classifier node
+
+    Args:
+        model: Compile-time model (defaults to DSPYGRAPH_COMPILE_MODEL or the
+            framework default)
+        output: Path for the compiled classifier JSON
+        num_threads: Thread count for candidate and trainset evaluation
+            (defaults to DSPYGRAPH_COMPILE_THREADS or CPU count)
+        optimizer: 'random-search' (threaded candidate search) or 'bootstrap'
+    """
     print("Compiling QuestionClassifier node...")
 
-    # Configure DSPy for compilation
-    lm = dspy.LM("openai/gpt-4o-mini")
-    dspy.configure(lm=lm)
+    # Configure DSPy for compilation. Compilation is an offline build step,
+    # so it can target a cheaper (e.g. batch-discounted) deployment than the
+    # runtime model.
+    configure_dspy(model or os.getenv("DSPYGRAPH_COMPILE_MODEL", DEFAULT_MODEL))
 
     # Create classifier node
     classifier = QuestionClassifierNode("classifier")
 
-    # Convert training data to DSPy Examples
-    trainset = [
-        dspy.Example(question=question, category=category).with_inputs("question")
-        for question, category in TRAINING_DATA
-    ]
+    # Convert training data to DSPy Examples (memoized across invocations)
+    trainset = list(get_trainset())
 
     # Create compiler and compile
-    compiler = BootstrapFewShot(metric=classification_metric)
-    classifier.compile(compiler, trainset, compile_path="compiled_classifier.json")
-    print("Compiled classifier saved to compiled_classifier.json")
+    eval_threads = num_threads or compile_num_threads()
+    compiler = build_compiler(optimizer, eval_threads)
+    classifier.compile(compiler, trainset, compile_path=output)
+    print(f"Compiled classifier saved to {output}")
+
+    # Evaluate the compiled classifier on the trainset with threaded LM calls
+    evaluator = Evaluate(
+        devset=trainset,
+        metric=classification_metric,
+        num_threads=eval_threads,
+        display_progress=True,
+    )
+    score = evaluator(classifier.module)
+    print(f"Trainset accuracy after compilation: {score}")
 
 
 def main() -> None:
     """Main compilation entry point"""
+    parser = argparse.ArgumentParser(description="Compile the question classifier")
+    parser.add_argument(
+        "--model",
+        default=None,
+        help="Compile-time model (litellm format, e.g. openai/gpt-4o-mini)",
+    )
+    parser.add_argument(
+        "--output",
+        default="compiled_classifier.json",
+        help="Path for the compiled classifier JSON",
+    )
+    parser.add_argument(
+        "--num-threads",
+        type=int,
+        default=None,
+        help="Thread count for candidate and trainset evaluation",
+    )
+    parser.add_argument(
+        "--optimizer",
+        choices=["random-search", "bootstrap"],
+        default="random-search",
+        help="Teleprompter used for compilation",
+    )
+    args = parser.parse_args()
+
     print("Starting classifier node compilation...")
-    compile_classifier()
+    compile_classifier(
+        model=args.model,
+        output=args.output,
+        num_threads=args.num_threads,
+        optimizer=args.optimizer,
+    )
     print("Compilation complete!")
 
 
@@ -2,17 +2,64 @@
 Graph-based implementation for the question classifier application
 """
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final
+
 import dspy
 
-from dspygraph import END, START, Graph
+from dspygraph import END, START, Graph, configure_dspy
 
 from .nodes import (
     CreativeResponseNode,
     FactualAnswerNode,
+    FusedClassifierNode,
     QuestionClassifierNode,
     ToolUseNode,
 )
 
+# Classification -> response-node routing table, built once at import time.
+# QuestionCategory values are a closed set, so both edge wiring and the
+# per-run router derive from this single constant; anything not listed
+# routes to END as 'unknown'.
+_CLASSIFICATION_ROUTES: Final[dict[str, str]] = {
+    "factual": "factual_answer",
+    "creative": "creative_response",
+    "tool_use": "tool_use",
+}
+
+
+def _normalize_classification(state) -> str:
+    """Normalize a state's classification the same way the compilation metric does
+
+    The LM emits cosmetically different category strings ("Factual",
+    "factual "); every routing path compares through this helper so they
+    all agree with the metric.
+    """
+    return str(state.get("classification", "")).strip().lower()
+
+
+def _route_by_classification(state) -> str:
+    """Route based on classification result"""
+    # Normalized categories should route, not fall through to END
+    classification = _normalize_classification(state)
+    return classification if classification in _CLASSIFICATION_ROUTES else "unknown"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_compiled_classifier_module(path: str, mtime: float) -> dspy.Module:
+    """
+    Load the compiled classifier module once per (path, mtime)
+
+    Repeated graph constructions (e.g. a loop of run_question_classifier
+    calls) would otherwise re-open and re-parse the compiled JSON each time;
+    the mtime key keeps the cache honest when the file is recompiled.
+    """
+    classifier = QuestionClassifierNode("classifier")
+    classifier.load_compiled(path)
+    return classifier.module
+
 
 def create_question_classifier_graph() -> Graph:
     """
@@ -39,39 +86,25 @@ def create_question_classifier_graph() -> Graph:
     # Add explicit START edge
     graph.add_edge(START, "classifier")
 
-    # Define routing logic
-    def route_by_classification(state):
-        """Route based on classification result"""
-        classification = state.get("classification", "")
-        if "factual" in classification:
-            return "factual"
-        elif "creative" in classification:
-            return "creative"
-        elif "tool_use" in classification:
-            return "tool_use"
-        else:
-            return "unknown"
-
-    # Add conditional edges from classifier to response nodes
+    # Wire conditional edges straight from the module-level routing table;
+    # the router is a single O(1) membership test against the same constant
     graph.add_conditional_edges(
         "classifier",
-        {
-            "factual": "factual_answer",
-            "creative": "creative_response",
-            "tool_use": "tool_use",
-            "unknown": END,
-        },
-        route_by_classification,
+        {**_CLASSIFICATION_ROUTES, "unknown": END},
+        _route_by_classification,
     )
 
     # Add explicit END edges for each response type
-    graph.add_edge("factual_answer", END)
-    graph.add_edge("creative_response", END)
-    graph.add_edge("tool_use", END)
+    for response_node in _CLASSIFICATION_ROUTES.values():
+        graph.add_edge(response_node, END)
 
-    # Load compiled classifier
+    # Load compiled classifier (memoized across graph constructions)
     try:
-        classifier.load_compiled("compiled_classifier.json")
+        compiled_path = "compiled_classifier.json"
+        classifier.module = _load_compiled_classifier_module(
+            compiled_path, os.path.getmtime(compiled_path)
+        )
+        classifier.compiled = True
         print("Loaded compiled classifier for graph")
     except (FileNotFoundError, Exception):
         print("Warning: No compiled classifier found. Run compile_classifier.py first")
@@ -79,6 +112,58 @@ def create_question_classifier_graph() -> Graph:
     return graph
 
 
+def create_fused_question_classifier_graph() -> Graph:
+    """
+    Create a question classifier graph with fused classify+answer
+
+    Factual and creative questions are answered in the classifier's own LM
+    call, halving round-trips on that traffic; only tool_use questions route
+    to a second node.
+
+    Returns:
+        Configured Graph ready to run
+    """
+    graph = Graph("FusedQuestionClassifier")
+
+    classifier = FusedClassifierNode("classifier")
+    tool_use = ToolUseNode("tool_use")
+
+    graph.add_node(classifier)
+    graph.add_node(tool_use)
+
+    graph.add_edge(START, "classifier")
+
+    def route_fused(state):
+        """Route onward only when the fused call produced no answer"""
+        if state.get("response"):
+            return "answered"
+        if _normalize_classification(state) == "tool_use":
+            return "tool_use"
+        return "unknown"
+
+    graph.add_conditional_edges(
+        "classifier",
+        {"answered": END, "tool_use": "tool_use", "unknown": END},
+        route_fused,
+    )
+    graph.add_edge("tool_use", END)
+
+    return graph
+
+
+@functools.lru_cache(maxsize=1)
+def _default_graph() -> Graph:
+    """
+    Build the default classifier graph once and reuse it
+
+    Graph construction rebuilds every node's DSPy module, so paying it per
+    question turns a cheap routing step into the dominant fixed cost of a
+    request loop. Graph.run keeps all per-run state local, so one shared
+    instance is safe to reuse (and to run concurrently).
+    """
+    return create_question_classifier_graph()
+
+
 def run_question_classifier(question: str) -> dict:
     """
     Run the question classifier graph on a single question
@@ -89,12 +174,11 @@ def run_question_classifier(question: str) -> dict:
     Returns:
         Complete graph execution result
     """
-    # Configure DSPy
-    lm = dspy.LM("openai/gpt-4o-mini")
-    dspy.configure(lm=lm)
+    # Configure DSPy (idempotent: the LM client is cached per model)
+    configure_dspy()
 
-    # Create and run graph
-    graph = create_question_classifier_graph()
+    # Reuse the cached graph across calls
+    graph = _default_graph()
 
     # Execute with the question
     result = graph.run(question=question)
@@ -102,6 +186,52 @@ def run_question_classifier(question: str) -> dict:
     return result
 
 
+def run_question_classifier_speculative(question: str) -> dict:
+    """
+    Run the classifier and all response nodes concurrently, keep the winner
+
+    Sequential routing pays classify latency plus branch latency; launching
+    every branch alongside the classifier cuts wall-clock to roughly the
+    slower of the two, at the cost of two discarded LM calls per question.
+    Use run_question_classifier when spend matters more than latency.
+
+    Args:
+        question: The question to classify and answer
+
+    Returns:
+        Question, classification, and the winning branch's outputs
+    """
+    configure_dspy()
+    graph = _default_graph()
+
+    state = {"question": question}
+    classifier = graph.nodes["classifier"]
+    branches = {
+        category: graph.nodes[node_name]
+        for category, node_name in _CLASSIFICATION_ROUTES.items()
+    }
+
+    with ThreadPoolExecutor(max_workers=1 + len(branches)) as pool:
+        classify_future = pool.submit(classifier, state)
+        branch_futures = {
+            category: pool.submit(node, dict(state))
+            for category, node in branches.items()
+        }
+
+        classification = _normalize_classification(classify_future.result())
+
+        result = {"question": question, "classification": classification}
+        winner = branch_futures.get(classification)
+        if winner is not None:
+            # Keep only the winning branch; the losers finish in the pool
+            # and are discarded
+            for key, value in winner.result().items():
+                if not key.startswith("_"):
+                    result[key] = value
+
+    return result
+
+
 if __name__ == "__main__":
     # Test the graph
     test_questions = [
@@ -2,14 +2,24 @@
 Simplified DSPy nodes for the question classifier application
 """
 
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import dspy
 
-from dspygraph import Node
+from dspygraph import Node, get_lm
 
 from .types import QuestionCategory
 
+# Per-call trace output is debug-level and lazily formatted: under threaded
+# compilation or batched runs, per-call prints serialize on the stdout lock
+# and pay f-string formatting whether or not anyone is watching
+logger = logging.getLogger("question_classifier")
+
 
 class QuestionClassificationSignature(dspy.Signature):
     """Classifies a user's question into a specific category."""
@@ -20,29 +30,226 @@ class QuestionClassificationSignature(dspy.Signature):
     )
 
 
+class BatchQuestionClassificationSignature(dspy.Signature):
+    """Classifies several user questions in a single call."""
+
+    questions: list[str] = dspy.InputField(desc="The users' questions, in order")
+    categories: list[QuestionCategory] = dspy.OutputField(
+        desc="One classification category per question, in the same order"
+    )
+
+
+class BatchClassifyAnswerSignature(dspy.Signature):
+    """Classifies several questions and answers each of them in a single call."""
+
+    questions: list[str] = dspy.InputField(desc="The users' questions, in order")
+    categories: list[QuestionCategory] = dspy.OutputField(
+        desc="One classification category per question, in the same order"
+    )
+    answers: list[str] = dspy.OutputField(
+        desc="One answer per question, in the same order"
+    )
+
+
 class QuestionClassifierNode(Node):
     """Node that classifies questions into categories"""
 
+    # Questions per LM call when classifying in bulk; amortizes the shared
+    # prompt prefix across the batch
+    BATCH_SIZE = 8
+
+    # Decode budget for a classification: the category is 1-2 tokens, plus
+    # the chat adapter's field markers. Decoding is the latency-dominant
+    # phase, so capping it keeps the classifier to a handful of decode steps.
+    MAX_CLASSIFICATION_TOKENS = 32
+
+    # Entries kept in the per-node classification memo before evicting the
+    # oldest; classification is invariant to case and edge whitespace, so
+    # retried questions (debugging, A/B runs) hit without an LM call even
+    # when dspy's request cache is cold
+    _MEMO_SIZE = 1024
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        # Lock keeps the get/move_to_end and insert/evict sequences atomic
+        # when the graph runs nodes from pool threads
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        self._memo_lock = threading.Lock()
+
     def _create_module(self) -> dspy.Module:
-        return dspy.Predict(QuestionClassificationSignature)
+        return dspy.Predict(
+            QuestionClassificationSignature,
+            max_tokens=self.MAX_CLASSIFICATION_TOKENS,
+        )
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         """Classify the question from state"""
+        question_norm = state["question"].strip().lower()
+        with self._memo_lock:
+            category = self._memo.get(question_norm)
+            if category is not None:
+                self._memo.move_to_end(question_norm)
+        if category is None:
+            result = self.module(question=state["question"])
+            category = result.category
+            with self._memo_lock:
+                self._memo[question_norm] = category
+                if len(self._memo) > self._MEMO_SIZE:
+                    self._memo.popitem(last=False)
+        logger.debug("  -> Classified as: %s", category)
+        return {"classification": category}
+
+    def classify_batch(self, questions: list[str]) -> list[str]:
+        """
+        Classify many questions with one LM call per batch of BATCH_SIZE
+
+        Bulk workloads (trainset evaluation, backlogs) pay one shared prompt
+        prefix per chunk instead of one full prompt per question. The
+        single-question signature stays in place for inference.
+        """
+        batch_module = dspy.Predict(BatchQuestionClassificationSignature)
+
+        categories: list[str] = []
+        for start in range(0, len(questions), self.BATCH_SIZE):
+            chunk = questions[start : start + self.BATCH_SIZE]
+            result = batch_module(questions=chunk)
+            categories.extend(result.categories)
+        return categories
+
+
+class HybridQuestionClassifierNode(QuestionClassifierNode):
+    """
+    Classifier with a local lexical fast-path and LM fallback
+
+    Scores the question against seed examples by token overlap; confident
+    matches classify locally in microseconds, everything else falls back to
+    the LM. Retains the same 'classification' output contract.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        examples: list[tuple[str, str]] | None = None,
+        confidence_threshold: float = 0.5,
+    ):
+        # (token-set, category) pairs for the lexical fast-path
+        self._seed_examples = [
+            (self._tokenize(question), category)
+            for question, category in (examples or [])
+        ]
+        self.confidence_threshold = confidence_threshold
+        super().__init__(name)
+
+    # Precompiled word pattern: one C-level scan over the question instead of
+    # a Python-level split + per-word strip loop
+    _WORD_RE = re.compile(r"[a-z0-9']+")
+
+    @classmethod
+    def _tokenize(cls, text: str) -> frozenset[str]:
+        """Lowercased word set with punctuation stripped"""
+        return frozenset(cls._WORD_RE.findall(text.lower()))
+
+    def _lexical_classify(self, question: str) -> tuple[str | None, float]:
+        """Return (category, confidence) for the best seed-example match"""
+        question_tokens = self._tokenize(question)
+        if not question_tokens:
+            return None, 0.0
+
+        best_category, best_score = None, 0.0
+        for seed_tokens, category in self._seed_examples:
+            union = len(question_tokens | seed_tokens)
+            score = len(question_tokens & seed_tokens) / union if union else 0.0
+            if score > best_score:
+                best_category, best_score = category, score
+        return best_category, best_score
+
+    def process(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Classify locally when confident, otherwise fall back to the LM"""
+        category, confidence = self._lexical_classify(state["question"])
+        if category is not None and confidence >= self.confidence_threshold:
+            logger.debug("  -> Classified as: %s (local, %.2f)", category, confidence)
+            return {"classification": category}
+
+        return super().process(state)
+
+
+class FusedClassifyAnswerSignature(dspy.Signature):
+    """Classifies a question and, when no tools are needed, answers it in the same call."""
+
+    question: str = dspy.InputField(desc="The user's question")
+    category: QuestionCategory = dspy.OutputField(
+        desc="Classification category of the question (e.g., 'factual', 'creative', 'tool_use', 'unknown')"
+    )
+    answer: str = dspy.OutputField(
+        desc="Direct answer for 'factual' or 'creative' questions; empty for 'tool_use' and 'unknown'"
+    )
+
+
+class FusedClassifierNode(Node):
+    """
+    Node that classifies a question and answers it in one LM call
+
+    Fuses the classify and answer steps so factual/creative traffic pays one
+    round-trip instead of two; only tool_use questions need a second node.
+    """
+
+    def _create_module(self) -> dspy.Module:
+        return dspy.Predict(FusedClassifyAnswerSignature)
+
+    def process(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Classify the question and answer it when no tools are needed"""
         result = self.module(question=state["question"])
-        print(f"  -> Classified as: {result.category}")
-        return {"classification": result.category}
+        logger.debug("  -> Classified as: %s", result.category)
+
+        outputs: dict[str, Any] = {"classification": result.category}
+        if result.category in ("factual", "creative") and result.answer:
+            logger.debug("  -> Fused answer: %.100s...", result.answer)
+            outputs["response"] = result.answer
+        return outputs
 
 
 class FactualAnswerNode(Node):
     """Node that provides factual answers using chain of thought reasoning"""
 
+    # Compiled artifact produced by an optimizer run over this node; its
+    # presence switches the module choice below
+    COMPILED_PATH = "compiled_factual.json"
+
     def _create_module(self) -> dspy.Module:
+        # ChainOfThought decodes its reasoning before the answer, roughly
+        # doubling output tokens per call. With compiled few-shot demos
+        # attached, plain Predict holds accuracy on short factual lookups
+        # at about half the decode length — so when the artifact is on
+        # disk, load its demos into a Predict; without them, keep the
+        # ChainOfThought fallback.
+        if os.path.exists(self.COMPILED_PATH):
+            module = dspy.Predict("question -> answer")
+            try:
+                module.load(self.COMPILED_PATH)
+            except Exception as e:
+                logger.warning(
+                    "Failed to load %s: %s; falling back to ChainOfThought",
+                    self.COMPILED_PATH,
+                    e,
+                )
+            else:
+                self.compiled = True
+                return module
         return dspy.ChainOfThought("question -> answer")
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         """Generate factual answer"""
-        result = self.module(question=state["question"])
-        print(f"  -> Factual answer: {result.answer[:100]}...")
+        # Short factual lookups don't need the premium model. When
+        # DSPYGRAPH_FACTUAL_MODEL names a cheaper deployment (e.g. a small
+        # quantized model behind a local vLLM endpoint), this branch runs
+        # there while the rest of the graph keeps the configured default.
+        factual_model = os.getenv("DSPYGRAPH_FACTUAL_MODEL")
+        if factual_model:
+            with dspy.context(lm=get_lm(factual_model)):
+                result = self.module(question=state["question"])
+        else:
+            result = self.module(question=state["question"])
+        logger.debug("  -> Factual answer: %.100s...", result.answer)
         return {"response": result.answer}
 
 
@@ -62,7 +269,7 @@ class CreativeResponseNode(Node):
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         """Generate creative response"""
         result = self.module(prompt=state["question"])
-        print(f"  -> Creative response: {result.creative_output[:100]}...")
+        logger.debug("  -> Creative response: %.100s...", result.creative_output)
         return {"response": result.creative_output}
 
 
@@ -79,5 +286,5 @@ class ToolUseNode(Node):
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         """Execute tool and return result"""
         result = self.module(query=state["question"])
-        print(f"  -> Tool output: {result.answer}")
+        logger.debug("  -> Tool output: %s", result.answer)
         return {"tool_output": result.answer, "response": result.answer}
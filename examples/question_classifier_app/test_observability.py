@@ -5,6 +5,8 @@ Test DSPy's built-in observability features with our graph framework
 import dspy
 from dspy.utils.callback import BaseCallback
 
+from dspygraph import configure_dspy
+
 from .graph import create_question_classifier_graph
 
 
@@ -40,9 +42,8 @@ class DetailedCallback(BaseCallback):
 def test_observability():
     """Test the graph with full DSPy observability enabled"""
 
-    # Configure DSPy with observability
-    lm = dspy.LM("openai/gpt-4o-mini")
-    dspy.configure(lm=lm)
+    # Configure DSPy with observability (shared client)
+    configure_dspy()
 
     # Enable logging and callbacks
     dspy.enable_logging()
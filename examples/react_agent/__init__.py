@@ -5,7 +5,7 @@ A DSPy graph-based implementation of a ReAct (Reasoning + Acting) agent that can
 to solve problems through iterative reasoning and action execution.
 """
 
-from .graph import create_react_agent_graph, run_react_agent
+from .graph import create_react_agent_graph, run_react_agent, run_react_agent_batch
 from .nodes import MaxStepsNode, ReactAgentNode, ToolExecutorNode
 from .tools import CalculatorTool, SearchTool, execute_tool, get_available_tools
 from .types import ActionType, ReactState, ToolResult
@@ -13,6 +13,7 @@ from .types import ActionType, ReactState, ToolResult
 __all__ = [
     "create_react_agent_graph",
     "run_react_agent",
+    "run_react_agent_batch",
     "ReactAgentNode",
     "ToolExecutorNode",
     "MaxStepsNode",
@@ -2,17 +2,52 @@
 Main application for the React agent example
 """
 
+import logging
+import sys
+
 import dspy
 
-from .graph import create_react_agent_graph, demonstrate_react_agent
+from dspygraph import configure_dspy
+
+from .graph import (
+    create_react_agent_graph,
+    demonstrate_react_agent,
+    run_react_agent_batch,
+)
 from .tools import get_available_tools
 
 
+def _configure_trace_logging() -> None:
+    """Route per-step trace output to stdout through one handler"""
+    trace_logger = logging.getLogger("react_agent")
+    if not trace_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        trace_logger.addHandler(handler)
+    trace_logger.setLevel(logging.INFO)
+    trace_logger.propagate = False
+
+
+def _run_batch(questions: list[str]) -> None:
+    """Run a batch of questions in parallel and print a summary"""
+    if not questions:
+        return
+    print(f"\n🔍 Processing {len(questions)} questions in parallel...")
+    results = run_react_agent_batch(questions, max_steps=6)
+    for question, result in zip(questions, results, strict=True):
+        print(f"\n💭 {question}")
+        print(f"✅ {result.get('final_answer', 'No answer provided')}")
+    total_steps = sum(result.get("step_count", 0) for result in results)
+    print(f"\n📊 Batch complete: {len(questions)} questions, {total_steps} total steps")
+
+
 def main() -> None:
     """Main application entry point for React agent"""
-    # Configure DSPy
-    lm = dspy.LM("openai/gpt-4o-mini")
-    dspy.configure(lm=lm)
+    # Configure DSPy (shared client, constructed once per model)
+    configure_dspy()
+
+    # Show node trace output on stdout
+    _configure_trace_logging()
 
     # Enable DSPy observability
     dspy.enable_logging()
@@ -39,7 +74,11 @@ def main() -> None:
     print()
 
     # Interactive mode
-    print("🎯 React Agent is ready! (type 'demo' for demonstration, 'quit' to exit)")
+    print(
+        "🎯 React Agent is ready! (type 'demo' for demonstration, "
+        "'batch: q1, q2, ...' or 'batch <file>' to run questions in parallel, "
+        "'quit' to exit)"
+    )
     print("-" * 55)
 
     while True:
@@ -53,6 +92,24 @@ def main() -> None:
                 print("\n🎬 Running demonstration...")
                 demonstrate_react_agent()
                 continue
+            elif user_input.lower().startswith("batch:"):
+                # Independent questions run as concurrent React loops, so the
+                # batch finishes in roughly the time of its slowest member
+                _run_batch([q.strip() for q in user_input[6:].split(",") if q.strip()])
+                continue
+            elif user_input.lower().startswith("batch "):
+                # One question per line in the given file
+                path = user_input[6:].strip()
+                try:
+                    with open(path) as question_file:
+                        questions = [
+                            line.strip() for line in question_file if line.strip()
+                        ]
+                except OSError as e:
+                    print(f"❌ Could not read '{path}': {e}")
+                    continue
+                _run_batch(questions)
+                continue
             elif not user_input:
                 continue
 
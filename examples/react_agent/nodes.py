@@ -2,6 +2,14 @@
 React agent nodes using DSPy and the graph framework
 """
 
+import functools
+import logging
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import dspy
@@ -10,49 +18,82 @@ from dspygraph import Node
 
 from .tools import execute_tool, get_available_tools
 
+# Per-step trace output goes through a logger instead of print: lazy
+# %-formatting, one handler-configured flush policy, and no stdout write
+# lock acquired per line in the hot loop (main.py attaches the handler)
+logger = logging.getLogger("react_agent")
+
+
+# The tool registry is fixed at import, so the action description — and with
+# it the signature's instruction block — is built once and never varies
+# between calls. A byte-identical prompt prefix is what lets provider-side
+# prompt caches skip prefill on the shared instructions (the LM client is
+# already constructed with cache=True in dspygraph.config).
+_TOOLS_TEXT = " or ".join(
+    f"'{name}: <input>' - {tool.description}"
+    for name, tool in get_available_tools().items()
+)
+_ACTION_DESC = f"Action to take: {_TOOLS_TEXT} or 'finish: <final_answer>'"
+
+# One pass over "tool: input" instead of an 'in' check, a split, and two
+# strips; DOTALL lets multi-line finish answers through
+_ACTION_RE = re.compile(r"\s*([A-Za-z_]+)\s*:\s*(.*)", re.DOTALL)
+
 
 class ReactReasoningSignature(dspy.Signature):
     """Signature for React reasoning - generates thought and action"""
 
     question: str = dspy.InputField(desc="The question to solve")
     previous_steps: str = dspy.InputField(
-        desc="Previous thoughts, actions, and observations"
+        desc="Previous thoughts, actions, and observations, oldest first"
     )
     thought: str = dspy.OutputField(
         desc="Current reasoning step - what you're thinking about the problem"
     )
-    action: str = dspy.OutputField(
-        desc="Action to take: 'calculator: <expression>' or 'search: <query>' or 'finish: <final_answer>'"
-    )
+    action: str = dspy.OutputField(desc=_ACTION_DESC)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_reasoning_module() -> dspy.Module:
+    """
+    Build the ChainOfThought reasoning module once
+
+    ChainOfThought construction introspects the signature's schema; caching
+    lets repeated graph builds (tests, the interactive 'demo' command)
+    reuse the same module. There is nothing to key on: the tool registry —
+    and with it the signature's action description — is frozen into
+    _ACTION_DESC at import, so every build wraps the same signature.
+    """
+    return dspy.ChainOfThought(ReactReasoningSignature)
 
 
 class ReactAgentNode(Node):
     """React agent that reasons and acts iteratively"""
 
-    def _create_module(self) -> dspy.Module:
-        # Create a dynamic signature with available tools
-        tools = get_available_tools()
-        tool_descriptions = []
-        for name, tool in tools.items():
-            tool_descriptions.append(f"'{name}: <input>' - {tool.description}")
-
-        tools_text = " or ".join(tool_descriptions)
-        action_desc = f"Action to take: {tools_text} or 'finish: <final_answer>'"
-
-        # Create signature with dynamic tool information
-        class DynamicReactSignature(dspy.Signature):
-            """Signature for React reasoning with available tools"""
-
-            question: str = dspy.InputField(desc="The question to solve")
-            previous_steps: str = dspy.InputField(
-                desc="Previous thoughts, actions, and observations"
-            )
-            thought: str = dspy.OutputField(
-                desc="Current reasoning step - what you're thinking about the problem"
-            )
-            action: str = dspy.OutputField(desc=action_desc)
+    # Only the most recent steps go into the prompt. Prompt tokens dominate
+    # per-step LLM cost and latency, so an unbounded history makes every
+    # later step slower and more expensive than the one before it.
+    _MAX_CONTEXT_STEPS = 8
+
+    # Entries kept in the reasoning memo before evicting the oldest
+    _MEMO_SIZE = 128
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        # LRU memo of (question, previous_steps) -> prediction. A model that
+        # loops, or repeated runs of the same question, revisit identical
+        # reasoning states; a hit skips an entire LLM round-trip. Keyed on
+        # the strings themselves rather than their hashes so collisions
+        # cannot replay the wrong step. The lock keeps the get/move_to_end
+        # and insert/evict sequences atomic when the graph runs nodes from
+        # pool threads.
+        self._memo: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._memo_lock = threading.Lock()
 
-        return dspy.ChainOfThought(DynamicReactSignature)
+    def _create_module(self) -> dspy.Module:
+        # The module-level signature already carries the tool descriptions;
+        # the built module is shared across node instances
+        return _build_reasoning_module()
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         """Process one step of React reasoning"""
@@ -60,101 +101,162 @@ class ReactAgentNode(Node):
         # Build context from previous steps
         previous_steps = self._build_context(state)
 
-        # Get reasoning from DSPy module
-        result = self.module(question=state["question"], previous_steps=previous_steps)
-
-        print(f"  🤔 Thought: {result.thought}")
-        print(f"  🎯 Action: {result.action}")
+        # Get reasoning from DSPy module, short-circuiting repeated states
+        memo_key = (state["question"], previous_steps)
+        with self._memo_lock:
+            result = self._memo.get(memo_key)
+            if result is not None:
+                self._memo.move_to_end(memo_key)
+        if result is None:
+            result = self.module(
+                question=state["question"], previous_steps=previous_steps
+            )
+            with self._memo_lock:
+                self._memo[memo_key] = result
+                if len(self._memo) > self._MEMO_SIZE:
+                    self._memo.popitem(last=False)
+
+        # Bind the prediction attributes once; each return path below is a
+        # single dict literal so the update is one BUILD_MAP
+        thought = result.thought
+        action = result.action
+        step_count = state.get("step_count", 0) + 1
+
+        logger.info("  🤔 Thought: %s\n  🎯 Action: %s", thought, action)
+
+        # Add to history. The graph shares one state dict per run, so the
+        # history lists are appended in place: O(1) per step instead of
+        # copying an ever-longer list every step of the loop.
+        thoughts = state.get("thoughts")
+        if thoughts is None:
+            return {
+                "current_thought": thought,
+                "current_action": action,
+                "step_count": step_count,
+                "thoughts": [],
+                "actions": [],
+                "observations": [],
+            }
 
-        # Update state with new thought and action
-        new_state = {
-            "current_thought": result.thought,
-            "current_action": result.action,
-            "step_count": state.get("step_count", 0) + 1,
+        actions = state["actions"]
+        thoughts.append(thought)
+        actions.append(action)
+        return {
+            "current_thought": thought,
+            "current_action": action,
+            "step_count": step_count,
+            "thoughts": thoughts,
+            "actions": actions,
         }
 
-        # Add to history
-        if "thoughts" not in state:
-            new_state["thoughts"] = []
-            new_state["actions"] = []
-            new_state["observations"] = []
-        else:
-            new_state["thoughts"] = state["thoughts"] + [result.thought]
-            new_state["actions"] = state["actions"] + [result.action]
-
-        return new_state
-
     def _build_context(self, state: dict[str, Any]) -> str:
-        """Build context string from previous steps"""
-        if not state.get("thoughts"):
+        """Build context string from the most recent steps"""
+        thoughts = state.get("thoughts") or []
+        if not thoughts:
             return "This is the first step."
 
-        context_parts = []
-
-        for i, (thought, action, obs) in enumerate(
-            zip(
-                state.get("thoughts", []),
-                state.get("actions", []),
-                state.get("observations", []),
-                strict=False,
+        # Keep step numbering stable when the window slides
+        first_step = max(0, len(thoughts) - self._MAX_CONTEXT_STEPS)
+
+        # One f-string per step fused by a single join, instead of four
+        # list appends and four intermediate strings per step
+        return "\n".join(
+            f"Step {first_step + i + 1}:\n  Thought: {thought}\n  Action: {action}\n  Observation: {obs}"
+            for i, (thought, action, obs) in enumerate(
+                zip(
+                    thoughts[first_step:],
+                    (state.get("actions") or [])[first_step:],
+                    (state.get("observations") or [])[first_step:],
+                    strict=False,
+                )
             )
-        ):
-            context_parts.append(f"Step {i + 1}:")
-            context_parts.append(f"  Thought: {thought}")
-            context_parts.append(f"  Action: {action}")
-            context_parts.append(f"  Observation: {obs}")
-
-        return "\n".join(context_parts)
+        )
 
 
 class ToolExecutorNode(Node):
     """Executes tools based on the agent's action"""
 
+    def __init__(self, name: str):
+        super().__init__(name)
+        # Bounded pool for fanning out multi-tool actions; tools are
+        # I/O-shaped (a real search would be network-bound), so independent
+        # calls should overlap instead of queuing
+        self._pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("TOOL_CONCURRENCY_LIMIT", "4"))
+        )
+
     def _create_module(self) -> dspy.Module:
         # This node doesn't use DSPy, just returns a mock module
         return dspy.Predict("dummy -> dummy")
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
-        """Execute the requested tool action"""
+        """Execute the requested tool action(s)"""
         action = state.get("current_action", "")
 
-        # Parse the action
+        # Parse the action; 'finish' always consumes the whole action so
+        # final answers may contain semicolons
         tool_name, tool_input = self._parse_action(action)
 
         if tool_name == "finish":
-            print(f"  ✅ Final Answer: {tool_input}")
+            logger.info("  ✅ Final Answer: %s", tool_input)
             return {
                 "final_answer": tool_input,
                 "current_observation": f"Task completed with answer: {tool_input}",
             }
 
-        # Execute the tool
-        tool_result = execute_tool(tool_name, tool_input)
+        # Independent tool calls may be batched as 'calculator: ...; search: ...'
+        calls = self._parse_multi_action(action)
 
-        if tool_result["success"]:
-            observation = f"Tool '{tool_name}' returned: {tool_result['result']}"
-            print(f"  👀 Observation: {observation}")
+        if len(calls) == 1:
+            # Single-tool fast path: skip the pool entirely
+            results = [execute_tool(*calls[0])]
         else:
-            observation = f"Tool '{tool_name}' failed: {tool_result['error']}"
-            print(f"  ❌ Error: {observation}")
+            results = list(
+                self._pool.map(lambda call: execute_tool(*call), calls)
+            )
+
+        # Format observations in action order
+        parts = []
+        for (name, _tool_input), tool_result in zip(calls, results, strict=True):
+            if tool_result["success"]:
+                part = f"Tool '{name}' returned: {tool_result['result']}"
+                logger.info("  👀 Observation: %s", part)
+            else:
+                part = f"Tool '{name}' failed: {tool_result['error']}"
+                logger.info("  ❌ Error: %s", part)
+            parts.append(part)
+
+        observation = "; ".join(parts)
+
+        # Update observations history in place (same sharing contract as the
+        # thought/action lists in ReactAgentNode)
+        observations = state.get("observations")
+        if observations is None:
+            observations = [observation]
+        else:
+            observations.append(observation)
 
-        # Update observations history
-        new_observations = state.get("observations", []) + [observation]
+        return {"current_observation": observation, "observations": observations}
 
-        return {"current_observation": observation, "observations": new_observations}
+    def _parse_multi_action(self, action: str) -> list[tuple[str, str]]:
+        """Parse a possibly semicolon-separated action into (tool, input) calls"""
+        calls = [
+            self._parse_action(segment)
+            for segment in action.split(";")
+            if segment.strip()
+        ]
+        return calls or [self._parse_action(action)]
 
     def _parse_action(self, action: str) -> tuple[str, str]:
         """Parse action string into tool name and input"""
-        action = action.strip()
-
-        # Look for patterns like "calculate: 2 + 3" or "search: capital of france"
-        if ":" in action:
-            parts = action.split(":", 1)
-            tool_name = parts[0].strip().lower()
-            tool_input = parts[1].strip()
-            return tool_name, tool_input
+        # Match patterns like "calculator: 2 + 3" or "search: capital of france";
+        # interning the tool name makes the registry lookup a pointer compare
+        match = _ACTION_RE.match(action)
+        if match:
+            return sys.intern(match.group(1).lower()), match.group(2).strip()
 
         # Handle "finish" without colon
+        action = action.strip()
         if action.lower().startswith("finish"):
             return "finish", action[6:].strip()
 
@@ -174,7 +276,9 @@ class MaxStepsNode(Node):
         max_steps = state.get("max_steps", 5)
 
         if step_count >= max_steps:
-            print(f"  ⚠️  Reached maximum steps ({max_steps}). Forcing completion.")
+            logger.info(
+                "  ⚠️  Reached maximum steps (%s). Forcing completion.", max_steps
+            )
             return {
                 "final_answer": "I've reached the maximum number of reasoning steps. Based on my analysis so far, I may need more information or a different approach to fully solve this problem.",
                 "current_observation": f"Reached maximum steps limit ({max_steps})",
@@ -2,11 +2,78 @@
 Simple tools for the React agent
 """
 
+import ast
+import functools
 import math
+import operator
 from typing import Any
 
 from .types import ToolResult
 
+# Operator and function whitelists for the calculator's AST evaluator.
+# Anything outside these tables is rejected, which is both stricter and
+# cheaper than the old character allow-list + eval().
+_CALC_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_CALC_FUNCS = {
+    "sqrt": math.sqrt,
+    "pow": math.pow,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "log": math.log,
+    "exp": math.exp,
+    "abs": abs,
+    "round": round,
+}
+
+_CALC_NAMES = {"pi": math.pi, "e": math.e}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse an expression once per distinct string"""
+    return ast.parse(expression, mode="eval").body
+
+
+def _eval_node(node: ast.expr) -> float:
+    """Evaluate a whitelisted arithmetic AST node"""
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)):
+            return node.value
+        raise ValueError(f"Unsupported constant: {node.value!r}")
+    if isinstance(node, ast.BinOp):
+        op = _CALC_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        return op(_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp):
+        op = _CALC_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        return op(_eval_node(node.operand))
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name) and not node.keywords:
+            func = _CALC_FUNCS.get(node.func.id)
+            if func is not None:
+                return func(*(_eval_node(arg) for arg in node.args))
+        raise ValueError("Unsupported function call")
+    if isinstance(node, ast.Name):
+        if node.id in _CALC_NAMES:
+            return _CALC_NAMES[node.id]
+        raise ValueError(f"Unknown name: {node.id}")
+    raise ValueError(f"Unsupported expression: {type(node).__name__}")
+
 
 class CalculatorTool:
     """Simple calculator tool for mathematical expressions"""
@@ -18,29 +85,10 @@ class CalculatorTool:
     def execute(self, expression: str) -> ToolResult:
         """Execute a mathematical calculation"""
         try:
-            # Clean the expression
-            expression = expression.strip()
-
-            # Simple safety check - only allow certain characters
-            allowed_chars = set("0123456789+-*/.() sqrt,pow,sin,cos,tan,log,exp")
-            if not all(c in allowed_chars or c.isspace() for c in expression):
-                return {
-                    "success": False,
-                    "result": "",
-                    "error": "Invalid characters in expression",
-                }
-
-            # Replace common function names with math module equivalents
-            expression = expression.replace("sqrt", "math.sqrt")
-            expression = expression.replace("pow", "math.pow")
-            expression = expression.replace("sin", "math.sin")
-            expression = expression.replace("cos", "math.cos")
-            expression = expression.replace("tan", "math.tan")
-            expression = expression.replace("log", "math.log")
-            expression = expression.replace("exp", "math.exp")
-
-            # Evaluate the expression
-            result = eval(expression, {"__builtins__": {}, "math": math})
+            # Parse (cached per distinct expression) and walk the AST
+            # directly: no compile() pipeline, no eval, and function names
+            # like sqrt resolve against the whitelist without string rewrites
+            result = _eval_node(_parse_expression(expression.strip()))
 
             return {"success": True, "result": str(result), "error": None}
 
@@ -73,17 +121,38 @@ class SearchTool:
             "quantum physics": "Quantum physics is the branch of physics that studies matter and energy at the smallest scales, typically atoms and subatomic particles.",
         }
 
+        # Inverted index: token -> knowledge-base keys containing it, built
+        # once so each query is tokenization + hash lookups instead of a
+        # substring scan over every key
+        self._index: dict[str, list[str]] = {}
+        for key in self.knowledge_base:
+            for word in key.split():
+                self._index.setdefault(word, []).append(key)
+
     def execute(self, query: str) -> ToolResult:
         """Execute a search query"""
         try:
             query_lower = query.lower().strip()
 
-            # Try to find a match in our knowledge base
-            for key, value in self.knowledge_base.items():
-                if key in query_lower or any(
-                    word in query_lower for word in key.split()
-                ):
-                    return {"success": True, "result": value, "error": None}
+            # Exact-match fast path
+            exact = self.knowledge_base.get(query_lower)
+            if exact is not None:
+                return {"success": True, "result": exact, "error": None}
+
+            # Token lookup against the inverted index
+            query_tokens = {word.strip(".,!?'\"") for word in query_lower.split()}
+            candidates = {
+                key for token in query_tokens for key in self._index.get(token, ())
+            }
+
+            # Keep knowledge-base order for deterministic results
+            for key in self.knowledge_base:
+                if key in candidates:
+                    return {
+                        "success": True,
+                        "result": self.knowledge_base[key],
+                        "error": None,
+                    }
 
             # Default response for unknown queries
             return {
@@ -96,20 +165,35 @@ class SearchTool:
             return {"success": False, "result": "", "error": f"Search error: {str(e)}"}
 
 
+# Tools are stateless after construction, so build them once at import.
+# execute_tool runs on every agent step; instantiating both tools (and the
+# search tool's knowledge base) per call was pure allocation churn.
+_TOOLS: dict[str, Any] = {"calculator": CalculatorTool(), "search": SearchTool()}
+
+
 def get_available_tools() -> dict[str, Any]:
     """Get all available tools as a dictionary"""
-    return {"calculator": CalculatorTool(), "search": SearchTool()}
+    return _TOOLS
 
 
-def execute_tool(tool_name: str, input_data: str) -> ToolResult:
-    """Execute a tool by name"""
-    tools = get_available_tools()
+@functools.lru_cache(maxsize=256)
+def _execute_tool_cached(tool_name: str, input_data: str) -> ToolResult:
+    """Execute a tool by name, memoized on (tool, input)"""
+    tool = _TOOLS.get(tool_name)
 
-    if tool_name not in tools:
+    if tool is None:
         return {
             "success": False,
             "result": "",
-            "error": f"Unknown tool: {tool_name}. Available tools: {list(tools.keys())}",
+            "error": f"Unknown tool: {tool_name}. Available tools: {list(_TOOLS.keys())}",
         }
 
-    return tools[tool_name].execute(input_data)
+    return tool.execute(input_data)
+
+
+def execute_tool(tool_name: str, input_data: str) -> ToolResult:
+    """Execute a tool by name"""
+    # Both tools are pure functions of their input, so repeated calls with
+    # the same arguments reuse the memoized result; callers get a copy so
+    # cached entries cannot be mutated
+    return dict(_execute_tool_cached(tool_name, input_data))
@@ -2,6 +2,8 @@
 Type definitions for the React agent example
 """
 
+from __future__ import annotations
+
 from typing import Literal, TypedDict
 
 
@@ -3,8 +3,12 @@
 Simple example demonstrating pure DSPy usage
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import dspy
 
+from dspygraph import configure_dspy
+
 
 class SimpleAnswerSignature(dspy.Signature):
     """Answer a question in a helpful way."""
@@ -24,12 +28,23 @@ class SimpleAgent:
         prediction = self.module(question=question)
         return prediction.answer
 
+    def run_many(self, questions: list[str], max_workers: int = 8) -> list[str]:
+        """
+        Answer independent questions concurrently
+
+        The calls are network-bound, so N questions take roughly the time of
+        the slowest one instead of their sum.
+        """
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(questions)) or 1
+        ) as pool:
+            return list(pool.map(self.run, questions))
+
 
 def main():
     """Run the simple example"""
-    # Configure DSPy directly
-    lm = dspy.LM("openai/gpt-4o-mini")
-    dspy.configure(lm=lm)
+    # Configure DSPy (shared client, constructed once per model)
+    configure_dspy()
 
     # Create the agent
     agent = SimpleAgent()
@@ -41,9 +56,10 @@ def main():
         "What is the meaning of life?",
     ]
 
-    for question in questions:
+    # Fan the independent questions out, then print in order
+    answers = agent.run_many(questions)
+    for question, answer in zip(questions, answers, strict=True):
         print(f"\n🤔 Question: {question}")
-        answer = agent.run(question)
         print(f"💡 Answer: {answer}")
 
 
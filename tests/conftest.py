@@ -0,0 +1,35 @@
+"""
+Shared fixtures and stubs for the test suite
+"""
+
+from types import MappingProxyType
+from unittest.mock import MagicMock, Mock
+
+import dspy
+import pytest
+
+# One read-only empty token mapping shared by every test instead of a fresh
+# dict per fixture invocation
+_EMPTY_TOKENS = MappingProxyType({})
+
+# One shared inert module for test nodes that never call their module: they
+# skip per-node Mock construction entirely
+_MODULE_STUB = type("ModuleStub", (), {})()
+
+
+@pytest.fixture(autouse=True)
+def _mock_track_usage(monkeypatch):
+    """Install one shared dspy.track_usage mock for every test
+
+    Modules that need real token accounting (e.g. the cache tests) override
+    this fixture locally with a no-op.
+    """
+    # spec_set pins the attribute surface, so Mock skips its dynamic
+    # child-attribute factory for anything else
+    usage = Mock(spec_set=["get_total_tokens"])
+    usage.get_total_tokens.return_value = _EMPTY_TOKENS
+    tracker = MagicMock()
+    tracker.__enter__.return_value = usage
+    tracker.__exit__.return_value = None
+    monkeypatch.setattr(dspy, "track_usage", lambda: tracker)
+    return usage
@@ -0,0 +1,117 @@
+"""
+Tests for the node response cache
+"""
+
+from typing import Any
+from unittest.mock import Mock
+
+import dspy
+import pytest
+
+from dspygraph import InvocationCache, Node, ResponseCache
+
+
+@pytest.fixture(autouse=True)
+def _mock_track_usage():
+    """Override the conftest stub: these tests exercise real usage tracking"""
+    yield
+
+
+class CachedTestNode(Node):
+    """Node that counts how many times process runs"""
+
+    def __init__(self, name: str, cache: ResponseCache | InvocationCache | None = None):
+        self.process_calls = 0
+        super().__init__(name, cache=cache)
+
+    def _create_module(self) -> dspy.Module:
+        return Mock()
+
+    def process(self, state: dict[str, Any]) -> dict[str, Any]:
+        self.process_calls += 1
+        return {"answer": f"answer to {state['question']}"}
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache"""
+
+    def test_cache_hit_skips_process(self, tmp_path):
+        """Test that a second identical call is served from cache"""
+        cache = ResponseCache(str(tmp_path / "cache.jsonl"))
+        node = CachedTestNode("cached", cache=cache)
+
+        first = node({"question": "What is the capital of France?"})
+        second = node({"question": "What is the capital of France?"})
+
+        assert node.process_calls == 1
+        assert first["answer"] == second["answer"]
+        assert second["_node_metadata"]["cached"] is True
+
+    def test_normalized_questions_share_entry(self, tmp_path):
+        """Test that case/whitespace/punctuation variants hit the same entry"""
+        cache = ResponseCache(str(tmp_path / "cache.jsonl"))
+        node = CachedTestNode("cached", cache=cache)
+
+        node({"question": "What is the capital of France?"})
+        node({"question": "  what is the capital of FRANCE  "})
+
+        assert node.process_calls == 1
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test that entries written to disk are reloaded"""
+        path = str(tmp_path / "cache.jsonl")
+        node1 = CachedTestNode("cached", cache=ResponseCache(path))
+
+        node1({"question": "What is 2 + 2?"})
+
+        node2 = CachedTestNode("cached", cache=ResponseCache(path))
+        node2({"question": "What is 2 + 2?"})
+
+        assert node2.process_calls == 0
+
+    def test_model_change_invalidates_entries(self, tmp_path):
+        """Test that a different model name misses old entries"""
+        path = str(tmp_path / "cache.jsonl")
+        node1 = CachedTestNode("cached", cache=ResponseCache(path, model_name="a"))
+
+        node1({"question": "What is 2 + 2?"})
+
+        node2 = CachedTestNode("cached", cache=ResponseCache(path, model_name="b"))
+        node2({"question": "What is 2 + 2?"})
+
+        assert node2.process_calls == 1
+
+    def test_node_without_cache_unaffected(self):
+        """Test that nodes default to no caching"""
+        node = CachedTestNode("plain")
+
+        node({"question": "hello"})
+        node({"question": "hello"})
+
+        assert node.process_calls == 2
+
+
+class TestInvocationCache:
+    """Test suite for InvocationCache"""
+
+    def test_cache_hit_skips_process(self):
+        """Test that a second identical call is served from memory"""
+        node = CachedTestNode("cached", cache=InvocationCache())
+
+        first = node({"question": "What is the capital of France?"})
+        second = node({"question": "what is the capital of FRANCE"})
+
+        assert node.process_calls == 1
+        assert first["answer"] == second["answer"]
+        assert second["_node_metadata"]["cached"] is True
+
+    def test_lru_eviction(self):
+        """Test that the oldest entry is evicted past max_entries"""
+        node = CachedTestNode("cached", cache=InvocationCache(max_entries=2))
+
+        node({"question": "one"})
+        node({"question": "two"})
+        node({"question": "three"})  # evicts "one"
+        node({"question": "one"})
+
+        assert node.process_calls == 4
@@ -2,6 +2,9 @@
 Tests for Node functionality
 """
 
+import copy
+import uuid
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -29,19 +32,74 @@ class ExampleTestNode(Node):
         return {"output": result.output_text}
 
 
+class _FakeModule:
+    """Hand-rolled stand-in for a DSPy module
+
+    Has exactly the attributes these tests read. Mock autogenerates a child
+    Mock on every attribute access and records every call, which is wasted
+    work on the node execution hot path; this class just stores what the
+    assertions need.
+    """
+
+    def __init__(self, output_text: str = "test output"):
+        self.output_text = output_text
+        self.saved_path: str | None = None
+        self.loaded_path: str | None = None
+        self.load_error: Exception | None = None
+
+    def __call__(self, **kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(output_text=self.output_text)
+
+    def save(self, path: str) -> None:
+        self.saved_path = path
+
+    def load(self, path: str) -> None:
+        if self.load_error is not None:
+            raise self.load_error
+        self.loaded_path = path
+
+
+# Template node cloned by make_node; built lazily once DSPy is configured
+_TEMPLATE: ExampleTestNode | None = None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _configure_dspy():
+    """Configure DSPy once with a mock LM to avoid API calls"""
+    dspy.configure(lm=Mock())
+
+
+@pytest.fixture
+def make_node():
+    """Factory for test nodes cloned from a single template
+
+    ExampleTestNode.__init__ runs dspy.Predict(MockSignature), which walks
+    the signature's field dict on every construction. Every test here
+    drives the module through a Mock anyway, so clone one template and
+    reset the per-instance fields instead of rebuilding the real module.
+    """
+
+    def factory(name: str) -> ExampleTestNode:
+        global _TEMPLATE
+        if _TEMPLATE is None:
+            _TEMPLATE = ExampleTestNode("template")
+        node = copy.copy(_TEMPLATE)
+        node.name = name
+        node.node_id = str(uuid.uuid4())
+        node.module = _FakeModule()
+        node.compiled = False
+        node._execution_count = 0
+        return node
+
+    return factory
+
+
 class TestNode:
     """Test suite for Node"""
 
-    def setup_method(self):
-        """Setup for each test"""
-        # Configure DSPy with a mock LM to avoid API calls
-        with patch("dspy.LM") as mock_lm:
-            mock_lm.return_value = Mock()
-            dspy.configure(lm=mock_lm.return_value)
-
-    def test_node_initialization(self):
+    def test_node_initialization(self, make_node):
         """Test basic node creation"""
-        node = ExampleTestNode("test_node")
+        node = make_node("test_node")
 
         assert node.name == "test_node"
         assert node.node_id is not None
@@ -50,28 +108,20 @@ class TestNode:
         assert node._execution_count == 0
         assert node.module is not None
 
-    def test_node_unique_ids(self):
+    def test_node_unique_ids(self, make_node):
         """Test that nodes get unique IDs"""
-        node1 = ExampleTestNode("node1")
-        node2 = ExampleTestNode("node2")
+        node1 = make_node("node1")
+        node2 = make_node("node2")
 
         assert node1.node_id != node2.node_id
 
-    @patch("dspy.track_usage")
-    def test_node_execution(self, mock_track_usage):
+    def test_node_execution(self, make_node, _mock_track_usage):
         """Test node execution with mocked DSPy"""
-        # Setup mock usage tracker
-        mock_usage = Mock()
-        mock_usage.get_total_tokens.return_value = {"total": 100}
-        mock_track_usage.return_value.__enter__.return_value = mock_usage
-        mock_track_usage.return_value.__exit__.return_value = None
-
-        # Setup mock DSPy module
-        node = ExampleTestNode("test_node")
-        mock_result = Mock()
-        mock_result.output_text = "test output"
-        node.module = Mock()
-        node.module.return_value = mock_result
+        # Report some usage for this test
+        _mock_track_usage.get_total_tokens.return_value = {"total": 100}
+
+        # The fake module answers "test output" for any input
+        node = make_node("test_node")
 
         # Test execution
         state = {"input": "test input"}
@@ -89,20 +139,31 @@ class TestNode:
         assert "execution_time" in metadata
         assert "usage" in metadata
 
-    def test_compilation_workflow(self):
+    def test_batch_call(self, make_node):
+        """Test batch execution over multiple states"""
+        node = make_node("test_node")
+        node.module = Mock(side_effect=lambda input_text: Mock(output_text=input_text))
+
+        states = [{"input": "a"}, {"input": "b"}, {"input": "c"}]
+        results = node.batch_call(states)
+
+        assert [result["output"] for result in results] == ["a", "b", "c"]
+        assert node._execution_count == 3
+        assert node.batch_call([]) == []
+
+    def test_compilation_workflow(self, make_node):
         """Test compilation methods"""
-        node = ExampleTestNode("test_node")
+        node = make_node("test_node")
 
         # Mock the module and compilation
-        mock_compiler = Mock()
+        mock_compiler = Mock(spec_set=["compile"])
         mock_compiled_module = Mock()
         mock_compiler.compile.return_value = mock_compiled_module
 
         trainset = [Mock()]
 
         # Test compilation
-        with patch("builtins.print"):  # Suppress prints
-            node.compile(mock_compiler, trainset, compile_path="test.json")
+        node.compile(mock_compiler, trainset, compile_path="test.json")
 
         assert node.compiled
         # The module should be replaced by the compiled one
@@ -110,63 +171,58 @@ class TestNode:
         # Verify compiler was called with original module
         mock_compiler.compile.assert_called_once()
 
-    def test_save_and_load_compiled(self):
+    def test_save_and_load_compiled(self, make_node):
         """Test save/load compiled module"""
-        node = ExampleTestNode("test_node")
-
-        # Mock module save/load
-        node.module.save = Mock()
-        node.module.load = Mock()
+        node = make_node("test_node")
 
         # Test save
-        with patch("builtins.print"):
-            node.save_compiled("test.json")
-        node.module.save.assert_called_once_with("test.json")
+        node.save_compiled("test.json")
+        assert node.module.saved_path == "test.json"
 
         # Test load
-        with patch("builtins.print"), patch("os.path.exists", return_value=True):
+        with patch("os.path.exists", return_value=True):
             node.load_compiled("test.json")
-        node.module.load.assert_called_once_with("test.json")
+        assert node.module.loaded_path == "test.json"
         assert node.compiled
 
-    def test_load_compiled_file_not_found(self):
+    def test_load_compiled_file_not_found(self, make_node):
         """Test load_compiled with missing file"""
-        node = ExampleTestNode("test_node")
+        node = make_node("test_node")
+        node.module.load_error = FileNotFoundError("missing.json")
 
-        with patch("os.path.exists", return_value=False):
-            with pytest.raises(FileNotFoundError):
-                node.load_compiled("missing.json")
+        with pytest.raises(FileNotFoundError):
+            node.load_compiled("missing.json")
+        assert not node.compiled
 
-    def test_ensure_compiled_already_compiled(self):
+    def test_ensure_compiled_already_compiled(self, make_node):
         """Test ensure_compiled when already compiled"""
-        node = ExampleTestNode("test_node")
+        node = make_node("test_node")
         node.compiled = True
 
         # Should not raise or do anything
         node.ensure_compiled()
         assert node.compiled
 
-    def test_ensure_compiled_with_file(self):
+    def test_ensure_compiled_with_file(self, make_node):
         """Test ensure_compiled with existing file"""
-        node = ExampleTestNode("test_node")
-        node.module.load = Mock()
+        node = make_node("test_node")
 
-        with patch("builtins.print"), patch("os.path.exists", return_value=True):
+        with patch("os.path.exists", return_value=True):
             node.ensure_compiled("test.json")
 
         assert node.compiled
-        node.module.load.assert_called_once_with("test.json")
+        assert node.module.loaded_path == "test.json"
 
-    def test_ensure_compiled_no_file(self):
+    def test_ensure_compiled_no_file(self, make_node):
         """Test ensure_compiled without file raises error"""
-        node = ExampleTestNode("test_node")
+        node = make_node("test_node")
 
         with pytest.raises(RuntimeError):
             node.ensure_compiled()
 
-    def test_node_repr(self):
+    def test_node_repr(self, make_node):
         """Test string representation"""
-        node = ExampleTestNode("test_node")
+        node = make_node("test_node")
         repr_str = repr(node)
 
         assert "test_node" in repr_str
@@ -2,13 +2,14 @@
 Tests for Graph functionality
 """
 
+import asyncio
 from typing import Any
-from unittest.mock import Mock, patch
 
 import dspy
 import pytest
 
 from dspygraph import END, START, Graph, Node
+from tests.conftest import _MODULE_STUB
 
 
 class SimpleTestNode(Node):
@@ -22,7 +23,7 @@ class SimpleTestNode(Node):
         super().__init__(name)
 
     def _create_module(self) -> dspy.Module:
-        return Mock()  # Don't need real DSPy module for workflow tests
+        return _MODULE_STUB  # Don't need real DSPy module for workflow tests
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         return {self.output_key: self.output_value}
@@ -32,25 +33,68 @@ class ConditionalTestNode(Node):
     """Node that reads state for conditional testing"""
 
     def _create_module(self) -> dspy.Module:
-        return Mock()
+        return _MODULE_STUB
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         # Echo the input for routing decisions
         return {"route": state.get("input", "default")}
 
 
+@pytest.fixture(scope="module")
+def linear_graph():
+    """Two-node linear graph shared by the read-only tests
+
+    Module-scoped: repr and visualization only inspect the graph, so one
+    construction serves them all. Tests that mutate topology build their
+    own graphs.
+    """
+    graph = Graph("test")
+    graph.add_node(SimpleTestNode("node1"))
+    graph.add_node(SimpleTestNode("node2"))
+    graph.add_edge(START, "node1")
+    graph.add_edge("node1", "node2")
+    graph.add_edge("node2", END)
+    return graph
+
+
+@pytest.fixture(scope="module")
+def conditional_graph():
+    """Conditional routing graph shared by all routing cases
+
+    Module-scoped: the topology is fixed and routing depends only on the
+    run's input, so each parametrized case reuses one graph instead of
+    rebuilding nodes and edges.
+    """
+    graph = Graph("test")
+    classifier = ConditionalTestNode("classifier")
+    path1_node = SimpleTestNode("path1", "result", "went_path1")
+    path2_node = SimpleTestNode("path2", "result", "went_path2")
+
+    def router(state):
+        route = state.get("route", "default")
+        if route == "option1":
+            return "path1"
+        elif route == "option2":
+            return "path2"
+        else:
+            return "end"
+
+    graph.add_node(classifier)
+    graph.add_node(path1_node)
+    graph.add_node(path2_node)
+
+    graph.add_edge(START, "classifier")
+    graph.add_conditional_edges(
+        "classifier", {"path1": "path1", "path2": "path2", "end": END}, router
+    )
+    graph.add_edge("path1", END)
+    graph.add_edge("path2", END)
+    return graph
+
+
 class TestGraph:
     """Test suite for Graph"""
 
-    def setup_method(self):
-        """Setup for each test"""
-        # Mock DSPy configuration
-        with patch("dspy.configure"), patch("dspy.track_usage") as mock_track:
-            mock_usage = Mock()
-            mock_usage.get_total_tokens.return_value = {}
-            mock_track.return_value.__enter__.return_value = mock_usage
-            mock_track.return_value.__exit__.return_value = None
-
     def test_workflow_initialization(self):
         """Test basic workflow creation"""
         graph = Graph("test_workflow")
@@ -68,9 +112,8 @@ class TestGraph:
         node1 = SimpleTestNode("node1")
         node2 = SimpleTestNode("node2")
 
-        with patch("builtins.print"):  # Suppress output
-            graph.add_node(node1)
-            graph.add_node(node2)
+        graph.add_node(node1)
+        graph.add_node(node2)
 
         assert len(graph.nodes) == 2
         assert "node1" in graph.nodes
@@ -83,11 +126,10 @@ class TestGraph:
         node1 = SimpleTestNode("duplicate")
         node2 = SimpleTestNode("duplicate")
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
+        graph.add_node(node1)
 
-            with pytest.raises(ValueError, match="already exists"):
-                graph.add_node(node2)
+        with pytest.raises(ValueError, match="already exists"):
+            graph.add_node(node2)
 
     def test_add_edge_basic(self):
         """Test adding basic edges"""
@@ -95,10 +137,9 @@ class TestGraph:
         node1 = SimpleTestNode("node1")
         node2 = SimpleTestNode("node2")
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_node(node2)
-            graph.add_edge("node1", "node2")
+        graph.add_node(node1)
+        graph.add_node(node2)
+        graph.add_edge("node1", "node2")
 
         assert len(graph.edges) == 1
         from_node, to_node, condition = graph.edges[0]
@@ -115,10 +156,9 @@ class TestGraph:
         def test_condition(state):
             return state.get("test", False)
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_node(node2)
-            graph.add_edge("node1", "node2", condition=test_condition)
+        graph.add_node(node1)
+        graph.add_node(node2)
+        graph.add_edge("node1", "node2", condition=test_condition)
 
         assert len(graph.edges) == 1
         from_node, to_node, condition = graph.edges[0]
@@ -131,9 +171,8 @@ class TestGraph:
         graph = Graph("test")
         node1 = SimpleTestNode("node1")
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_edge(START, "node1")
+        graph.add_node(node1)
+        graph.add_edge(START, "node1")
 
         assert "node1" in graph.start_nodes
         assert len(graph.edges) == 1
@@ -143,9 +182,8 @@ class TestGraph:
         graph = Graph("test")
         node1 = SimpleTestNode("node1")
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_edge("node1", END)
+        graph.add_node(node1)
+        graph.add_edge("node1", END)
 
         assert len(graph.edges) == 1
         from_node, to_node, condition = graph.edges[0]
@@ -155,16 +193,15 @@ class TestGraph:
         """Test adding edges with missing nodes"""
         graph = Graph("test")
 
-        with patch("builtins.print"):
-            # Missing source node (not START)
-            with pytest.raises(ValueError, match="Source node 'missing' not found"):
-                graph.add_edge("missing", "also_missing")
+        # Missing source node (not START)
+        with pytest.raises(ValueError, match="Source node 'missing' not found"):
+            graph.add_edge("missing", "also_missing")
 
-            # Missing target node (not END)
-            node1 = SimpleTestNode("node1")
-            graph.add_node(node1)
-            with pytest.raises(ValueError, match="Target node 'missing' not found"):
-                graph.add_edge("node1", "missing")
+        # Missing target node (not END)
+        node1 = SimpleTestNode("node1")
+        graph.add_node(node1)
+        with pytest.raises(ValueError, match="Target node 'missing' not found"):
+            graph.add_edge("node1", "missing")
 
     def test_add_conditional_edges(self):
         """Test adding conditional edges"""
@@ -176,14 +213,13 @@ class TestGraph:
         def router(state):
             return state.get("route", "default")
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_node(node2)
-            graph.add_node(node3)
+        graph.add_node(node1)
+        graph.add_node(node2)
+        graph.add_node(node3)
 
-            graph.add_conditional_edges(
-                "node1", {"path1": "node2", "path2": "node3", "end": END}, router
-            )
+        graph.add_conditional_edges(
+            "node1", {"path1": "node2", "path2": "node3", "end": END}, router
+        )
 
         assert len(graph.edges) == 3
 
@@ -198,25 +234,17 @@ class TestGraph:
             assert from_node == "node1"
             assert condition is not None
 
-    @patch("dspy.track_usage")
-    def test_simple_workflow_execution(self, mock_track_usage):
+    def test_simple_workflow_execution(self):
         """Test executing a simple linear workflow"""
-        # Setup mock
-        mock_usage = Mock()
-        mock_usage.get_total_tokens.return_value = {}
-        mock_track_usage.return_value.__enter__.return_value = mock_usage
-        mock_track_usage.return_value.__exit__.return_value = None
-
         graph = Graph("test")
         node1 = SimpleTestNode("node1", "step1", "value1")
         node2 = SimpleTestNode("node2", "step2", "value2")
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_node(node2)
-            graph.add_edge(START, "node1")
-            graph.add_edge("node1", "node2")
-            graph.add_edge("node2", END)
+        graph.add_node(node1)
+        graph.add_node(node2)
+        graph.add_edge(START, "node1")
+        graph.add_edge("node1", "node2")
+        graph.add_edge("node2", END)
 
         # Execute workflow
         result = graph.run(initial_input="test")
@@ -232,57 +260,26 @@ class TestGraph:
         assert metadata["execution_order"] == ["node1", "node2"]
         assert metadata["success"]
 
-    @patch("dspy.track_usage")
-    def test_conditional_workflow_execution(self, mock_track_usage):
+    @pytest.mark.parametrize(
+        ("input_value", "expected_result", "expected_order"),
+        [
+            ("option1", "went_path1", ["classifier", "path1"]),
+            ("option2", "went_path2", ["classifier", "path2"]),
+            # Unknown input routes straight to END without taking a path
+            ("unknown", None, ["classifier"]),
+        ],
+    )
+    def test_conditional_workflow_execution(
+        self, conditional_graph, input_value, expected_result, expected_order
+    ):
         """Test executing a workflow with conditional routing"""
-        # Setup mock
-        mock_usage = Mock()
-        mock_usage.get_total_tokens.return_value = {}
-        mock_track_usage.return_value.__enter__.return_value = mock_usage
-        mock_track_usage.return_value.__exit__.return_value = None
+        result = conditional_graph.run(input=input_value)
 
-        graph = Graph("test")
-        classifier = ConditionalTestNode("classifier")
-        path1_node = SimpleTestNode("path1", "result", "went_path1")
-        path2_node = SimpleTestNode("path2", "result", "went_path2")
-
-        def router(state):
-            route = state.get("route", "default")
-            if route == "option1":
-                return "path1"
-            elif route == "option2":
-                return "path2"
-            else:
-                return "end"
-
-        with patch("builtins.print"):
-            graph.add_node(classifier)
-            graph.add_node(path1_node)
-            graph.add_node(path2_node)
-
-            graph.add_edge(START, "classifier")
-            graph.add_conditional_edges(
-                "classifier", {"path1": "path1", "path2": "path2", "end": END}, router
-            )
-            graph.add_edge("path1", END)
-            graph.add_edge("path2", END)
-
-        # Test path1
-        result1 = graph.run(input="option1")
-        assert result1["result"] == "went_path1"
-        assert "path1" in result1["_graph_metadata"]["execution_order"]
-        assert "path2" not in result1["_graph_metadata"]["execution_order"]
-
-        # Test path2
-        result2 = graph.run(input="option2")
-        assert result2["result"] == "went_path2"
-        assert "path2" in result2["_graph_metadata"]["execution_order"]
-        assert "path1" not in result2["_graph_metadata"]["execution_order"]
-
-        # Test early termination
-        result3 = graph.run(input="unknown")
-        assert "result" not in result3  # No path taken
-        assert result3["_graph_metadata"]["execution_order"] == ["classifier"]
+        if expected_result is None:
+            assert "result" not in result
+        else:
+            assert result["result"] == expected_result
+        assert result["_graph_metadata"]["execution_order"] == expected_order
 
     def test_workflow_validation_no_nodes(self):
         """Test workflow validation with no nodes"""
@@ -291,34 +288,17 @@ class TestGraph:
         with pytest.raises(ValueError, match="has no nodes"):
             graph.run()
 
-    def test_workflow_repr(self):
+    def test_workflow_repr(self, linear_graph):
         """Test workflow string representation"""
-        graph = Graph("test")
-        node1 = SimpleTestNode("node1")
+        repr_str = repr(linear_graph)
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_edge(START, "node1")
-
-        repr_str = repr(graph)
         assert "test" in repr_str
-        assert "nodes=1" in repr_str
-        assert "edges=1" in repr_str
+        assert "nodes=2" in repr_str
+        assert "edges=3" in repr_str
 
-    def test_workflow_visualize(self):
+    def test_workflow_visualize(self, linear_graph):
         """Test workflow visualization"""
-        graph = Graph("test")
-        node1 = SimpleTestNode("node1")
-        node2 = SimpleTestNode("node2")
-
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_node(node2)
-            graph.add_edge(START, "node1")
-            graph.add_edge("node1", "node2")
-            graph.add_edge("node2", END)
-
-        viz = graph.visualize()
+        viz = linear_graph.visualize()
 
         assert "DSPy Graph: test" in viz
         assert "Nodes: 2" in viz
@@ -327,22 +307,14 @@ class TestGraph:
         assert "__START__ -> node1" in viz
         assert "node2 -> __END__" in viz
 
-    @patch("dspy.track_usage")
-    def test_execution_count_increments(self, mock_track_usage):
+    def test_execution_count_increments(self):
         """Test that execution count increments"""
-        # Setup mock
-        mock_usage = Mock()
-        mock_usage.get_total_tokens.return_value = {}
-        mock_track_usage.return_value.__enter__.return_value = mock_usage
-        mock_track_usage.return_value.__exit__.return_value = None
-
         graph = Graph("test")
         node1 = SimpleTestNode("node1")
 
-        with patch("builtins.print"):
-            graph.add_node(node1)
-            graph.add_edge(START, "node1")
-            graph.add_edge("node1", END)
+        graph.add_node(node1)
+        graph.add_edge(START, "node1")
+        graph.add_edge("node1", END)
 
         assert graph._execution_count == 0
 
@@ -351,3 +323,31 @@ class TestGraph:
 
         graph.run()
         assert graph._execution_count == 2
+
+    def test_run_without_metadata_collection(self):
+        """Test that collect_metadata=False skips metadata assembly"""
+        graph = Graph("test")
+        node1 = SimpleTestNode("node1", "step1", "value1")
+
+        graph.add_node(node1)
+        graph.add_edge(START, "node1")
+        graph.add_edge("node1", END)
+
+        result = graph.run(collect_metadata=False, input="test")
+
+        assert result["step1"] == "value1"
+        assert "_graph_metadata" not in result
+
+    def test_arun_executes_workflow(self):
+        """Test that the async entry point runs the graph to completion"""
+        graph = Graph("test")
+        node1 = SimpleTestNode("node1", "output", "async_result")
+
+        graph.add_node(node1)
+        graph.add_edge(START, "node1")
+        graph.add_edge("node1", END)
+
+        result = asyncio.run(graph.arun(input="test"))
+
+        assert result["output"] == "async_result"
+        assert result["_graph_metadata"]["success"] is True